@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
-from datetime import datetime, timezone
+import shutil
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import numpy as np
@@ -13,6 +16,11 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+try:
+    import orjson  # optional: `uv sync --extra fast`
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Page config
 # ---------------------------------------------------------------------------
@@ -26,8 +34,12 @@ st.set_page_config(
 # Helpers
 # ---------------------------------------------------------------------------
 
-@st.cache_data
-def load_report(path: str) -> dict:
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_report(path: str, mtime: float | None = None) -> dict:
+    # mtime is only part of the cache key: a regenerated report is re-read.
+    # The dict is never mutated, so every rerun shares it instead of unpickling a copy
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
     with open(path) as f:
         return json.load(f)
 
@@ -37,11 +49,25 @@ _COMMIT_TYPE_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Trailing "(#NNN)" GitHub appends to squash-merge subjects
+_PR_SUFFIX_RE = re.compile(r"\s*\(#\d+\)\s*$")
+
 def commit_type(message: str) -> str:
     m = _COMMIT_TYPE_RE.match(message.strip())
     return m.group(1).lower() if m else "other"
 
 
+def commit_types(messages: pd.Series) -> pd.Series:
+    """Vectorised :func:`commit_type` over a Series of commit messages."""
+    return (
+        messages.fillna("")
+        .str.strip()
+        .str.extract(_COMMIT_TYPE_RE, expand=False)
+        .str.lower()
+        .fillna("other")
+    )
+
+
 COMMIT_TYPE_COLORS: dict[str, str] = {
     "feat":     "#2ecc71",
     "fix":      "#e74c3c",
@@ -57,6 +83,19 @@ COMMIT_TYPE_COLORS: dict[str, str] = {
     "other":    "#95a5a6",
 }
 
+CHANGE_TYPE_COLORS: dict[str, str] = {
+    "added":    "#2ecc71",
+    "modified": "#3498db",
+    "removed":  "#e74c3c",
+    "renamed":  "#f39c12",
+}
+
+
+def _bold_color_css(values: pd.Series, colors: dict[str, str]) -> list[str]:
+    """Per-cell CSS for ``Styler.apply``: one vectorised lookup per column
+    instead of a Python callback per cell."""
+    return ("color: " + values.astype(str).map(colors) + "; font-weight: bold").fillna("").tolist()
+
 
 def _utc(dt: datetime) -> datetime:
     return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
@@ -97,6 +136,809 @@ def _beeswarm_y(x_numeric: np.ndarray, radii: np.ndarray, padding: float = 0.2)
     return y
 
 
+# Upper bound on points sent to the browser for a single line trace; roughly
+# the horizontal pixel count of a wide chart
+_LTTB_POINTS = 2000
+
+# Directory heatmap cells above which months are folded into coarser periods
+_HEATMAP_MAX_CELLS = 2000
+
+# Commit-size scatter points above which the chart is binned into a density grid
+_SCATTER_MAX_POINTS = 20_000
+_SCATTER_BINS = (300, 120)  # (x, y) cells of the density grid
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the (sorted) row positions of the *n_out* points that best
+    preserve the visual shape of the series. First and last points are kept.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(float) - float(x[0])
+    y = y.astype(float)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+
+    return idx
+
+
+def _nearest_indices(sorted_ts: np.ndarray, query_ts: np.ndarray) -> np.ndarray:
+    """Position of the nearest value in *sorted_ts* for every entry of *query_ts*.
+
+    Both arrays are int64 epochs. Ties resolve to the earlier value, matching
+    ``pd.merge_asof(direction="nearest")``.
+    """
+    n = len(sorted_ts)
+    back = np.searchsorted(sorted_ts, query_ts, side="right") - 1
+    fwd = np.searchsorted(sorted_ts, query_ts, side="left")
+    back_c = np.clip(back, 0, n - 1)
+    fwd_c = np.clip(fwd, 0, n - 1)
+    use_fwd = (back < 0) | (
+        (fwd < n) & (sorted_ts[fwd_c] - query_ts < query_ts - sorted_ts[back_c])
+    )
+    return np.where(use_fwd, fwd_c, back_c)
+
+
+def _sunburst_nodes(dir_counts: pd.DataFrame, max_depth: int | None = None) -> pd.DataFrame:
+    """Expand per-directory event counts into sunburst nodes.
+
+    Each path like "a/b/c" contributes its count to the nodes "a", "a/b" and
+    "a/b/c" (parents "", "a", "a/b"). Returns one row per node, indexed by
+    path in first-seen order, with ``parent``, ``count`` and ``change_type``
+    (the dominant type of the directory itself, "modified" for pure ancestors).
+
+    With *max_depth*, deeper directories are folded into their ancestor at
+    that depth, so no node below it is generated at all.
+    """
+    if max_depth is not None:
+        dir_counts = (
+            dir_counts.assign(
+                directory=dir_counts["directory"].astype(str).str.split("/").str[:max_depth].str.join("/")
+            )
+            .groupby(["directory", "change_type"], observed=True, sort=False)["count"]
+            .sum()
+            .reset_index()
+        )
+    directory = dir_counts["directory"].astype(str).reset_index(drop=True)
+    counts = dir_counts["count"].reset_index(drop=True)
+    parts = directory.str.split("/")
+    depth = parts.str.len()
+
+    # One vectorised pass per depth level instead of one Python loop per row
+    levels = []
+    for d in range(1, int(depth.max()) + 1):
+        deep_enough = depth >= d
+        levels.append(pd.DataFrame({
+            "row": deep_enough[deep_enough].index,
+            "depth": d,
+            "node": parts[deep_enough].str[:d].str.join("/"),
+            "count": counts[deep_enough],
+        }))
+    ancestors = pd.concat(levels, ignore_index=True).sort_values(["row", "depth"], kind="stable")
+    ancestors["parent"] = ancestors["node"].str.rpartition("/")[0]
+
+    nodes = ancestors.groupby("node", sort=False).agg(
+        parent=("parent", "first"),
+        count=("count", "sum"),
+    )
+    dominant = (
+        dir_counts.assign(directory=directory.to_numpy())
+        .sort_values("count", ascending=False, kind="stable")
+        .drop_duplicates("directory")
+        .set_index("directory")["change_type"]
+        .astype(str)
+    )
+    nodes["change_type"] = nodes.index.map(dominant).fillna("modified")
+    return nodes
+
+
+_FRAME_NAMES = ("commits", "merges", "folders", "diff", "loc", "commits_daily", "folders_daily")
+
+
+def _sidecar_dir(path: str) -> Path:
+    """Directory of Parquet tables cached next to the report (``report.parquet/``)."""
+    return Path(path).with_suffix(".parquet")
+
+
+def _sidecar_key(mtime: float) -> str:
+    """Identifies the report version *and* the frame layout (defined in this module)."""
+    h = hashlib.sha1(Path(__file__).read_bytes())
+    h.update(repr(mtime).encode())
+    return h.hexdigest()
+
+
+def _read_sidecar(path: str, mtime: float) -> dict[str, pd.DataFrame] | None:
+    """Load the frames from the sidecar, or ``None`` if it is missing or stale."""
+    sidecar = _sidecar_dir(path)
+    try:
+        if (sidecar / "KEY").read_text() != _sidecar_key(mtime):
+            return None
+        return {name: pd.read_parquet(sidecar / f"{name}.parquet") for name in _FRAME_NAMES}
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sidecar(path: str, mtime: float, frames: dict[str, pd.DataFrame]) -> None:
+    """Best-effort write of *frames* to the sidecar; a read-only location is fine."""
+    sidecar = _sidecar_dir(path)
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
+    try:
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        for name, df in frames.items():
+            df.to_parquet(tmp / f"{name}.parquet", index=False)
+        (tmp / "KEY").write_text(_sidecar_key(mtime))
+        shutil.rmtree(sidecar, ignore_errors=True)
+        tmp.rename(sidecar)
+    except (OSError, ValueError, ImportError):
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+@st.cache_data
+def _build_frames(path: str, mtime: float) -> dict[str, pd.DataFrame]:
+    """Parse the report into typed, sorted DataFrames (cached per file version).
+
+    ``commits`` is already enriched with diff stats, ``lines_changed`` and
+    ``commit_type``, and the per-day rollups feed the time-bucketed charts,
+    so reruns only have to filter. The result is also written
+    to a Parquet sidecar so a fresh server process can skip the JSON parsing;
+    the sidecar is rebuilt whenever the report or this module changes.
+    """
+    frames = _read_sidecar(path, mtime)
+    if frames is None:
+        frames = _frames_from_report(load_report(path, mtime))
+        _write_sidecar(path, mtime, frames)
+    return frames
+
+
+def _frames_from_report(report: dict) -> dict[str, pd.DataFrame]:
+    df_commits = pd.DataFrame(report.get("commit_log", []))
+    df_merges  = pd.DataFrame(report.get("merges", []))
+    df_folders = pd.DataFrame(report.get("folder_changes", []))
+    df_diff    = pd.DataFrame(report.get("diff_stats", {}).get("per_commit", []))
+    df_loc     = pd.DataFrame(report.get("loc_over_time", []))
+
+    for df, col in [
+        (df_commits, "committed_at"),
+        (df_merges,  "merged_at"),
+        (df_folders, "committed_at"),
+        (df_diff,    "committed_at"),
+        (df_loc,     "committed_at"),
+    ]:
+        if not df.empty and col in df.columns:
+            df[col] = pd.to_datetime(df[col], utc=True, format="ISO8601")
+
+    # Chronological order lets the date filter slice with searchsorted
+    df_merges, df_folders, df_diff, df_loc = (
+        df.sort_values(col, kind="stable", ignore_index=True) if not df.empty and col in df.columns else df
+        for df, col in [
+            (df_merges,  "merged_at"),
+            (df_folders, "committed_at"),
+            (df_diff,    "committed_at"),
+            (df_loc,     "committed_at"),
+        ]
+    )
+
+    if not df_merges.empty and "message" in df_merges.columns:
+        # Merge-marker hover text and PR Explorer slider titles:
+        # "PR #NNN — first line of message (clipped to 60 chars)"
+        df_merges["pr_subject"] = (
+            df_merges["message"]
+            .str.split("\n", n=1).str[0]     # first line only
+            .str.replace(_PR_SUFFIX_RE, "", regex=True)  # strip trailing (#NNN)
+            .str.strip()
+            .str[:60]
+        )
+        fallback = df_merges.get("merged_branch", pd.Series("", index=df_merges.index))
+        pr_number_str = (
+            ("PR #" + df_merges["pr_number"].astype("Int64").astype("string")).fillna(fallback)
+            if "pr_number" in df_merges.columns
+            else fallback
+        )
+        df_merges["pr_label"] = pr_number_str + " — " + df_merges["pr_subject"]
+        df_merges["pr_title"] = pr_number_str + "  —  " + df_merges["pr_subject"]
+
+    if not df_commits.empty:
+        df_commits = df_commits.sort_values("committed_at", ignore_index=True)
+
+        # Enrich commits with diff stats
+        if not df_diff.empty:
+            df_commits = df_commits.join(
+                df_diff.set_index("sha")[["insertions", "deletions", "files_changed"]],
+                on="short_sha",
+            )
+            df_commits["lines_changed"] = df_commits["insertions"].fillna(0) + df_commits["deletions"].fillna(0)
+            df_commits["commit_type"] = commit_types(df_commits["message"]).astype("category")
+
+    # Low-cardinality string columns used as groupby / isin / colour keys
+    for df, cols in [
+        (df_commits, ["author_name"]),
+        (df_folders, ["directory", "change_type"]),
+    ]:
+        for col in cols:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+
+    # Per-day rollups. The date filter works in whole days, so slicing these
+    # gives the same period totals as bucketing the raw rows, from far fewer rows
+    commits_daily = pd.DataFrame()
+    if not df_commits.empty:
+        daily_aggs = {"commits": ("short_sha", "size")}
+        if "insertions" in df_commits.columns:
+            daily_aggs["insertions"] = ("insertions", "sum")
+            daily_aggs["deletions"] = ("deletions", "sum")
+        commits_daily = (
+            df_commits.groupby(
+                [df_commits["committed_at"].dt.floor("D").rename("day"), "author_name"],
+                observed=True,
+            )
+            .agg(**daily_aggs)
+            .reset_index()
+        )
+
+    folders_daily = pd.DataFrame()
+    if not df_folders.empty:
+        folders_daily = (
+            df_folders.groupby(
+                [df_folders["committed_at"].dt.floor("D").rename("day"), "directory", "change_type"],
+                observed=True,
+            )
+            .size()
+            .reset_index(name="events")
+        )
+
+    return {
+        "commits": df_commits,
+        "merges":  df_merges,
+        "folders": df_folders,
+        "diff":    df_diff,
+        "loc":     df_loc,
+        "commits_daily": commits_daily,
+        "folders_daily": folders_daily,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Figure builders — cached on their exact inputs, so a rerun triggered by an
+# unrelated widget skips both the pandas work and the figure assembly.
+# Figures are read-only once built, so cache_resource hands back the same
+# object instead of unpickling a fresh copy on every hit. Every chart is
+# rendered with a fixed key= so its element identity is stable across reruns.
+# ---------------------------------------------------------------------------
+_figure_cache = st.cache_resource(max_entries=16, show_spinner=False)
+
+
+@_figure_cache
+def _loc_figure(loc: pd.DataFrame, merges: pd.DataFrame | None, smooth_win: int | None) -> go.Figure:
+    loc_sorted = loc.sort_values("committed_at")
+    if smooth_win:
+        loc_sorted["plot_loc"] = loc_sorted["cumulative_loc"].rolling(smooth_win, min_periods=1).mean()
+    else:
+        loc_sorted["plot_loc"] = loc_sorted["cumulative_loc"]
+
+    # Downsample the line only; merge markers below still snap to the full series
+    loc_plot = loc_sorted.iloc[_lttb_indices(
+        loc_sorted["committed_at"].values.view("i8"),
+        loc_sorted["plot_loc"].to_numpy(),
+        _LTTB_POINTS,
+    )]
+
+    fig_loc = go.Figure()
+    fig_loc.add_trace(go.Scattergl(
+        x=loc_plot["committed_at"].tolist(),
+        y=loc_plot["plot_loc"].tolist(),
+        mode="lines",
+        name="Cumulative LOC",
+        line=dict(width=2),
+        hovertemplate=(
+            "<b>%{x|%Y-%m-%d}</b><br>"
+            "LOC: %{y:,.0f}<br>"
+            "SHA: %{customdata}<extra></extra>"
+        ),
+        customdata=loc_plot["sha"].tolist(),
+    ))
+
+    if merges is not None and not merges.empty:
+        # Overlay merge events as scatter markers on the LOC line,
+        # snapped to the nearest LOC sample
+        nearest = _nearest_indices(
+            loc_sorted["committed_at"].values.view("i8"),
+            merges["merged_at"].values.view("i8"),
+        )
+        merge_y = loc_sorted["plot_loc"].to_numpy()[nearest]
+
+        fig_loc.add_trace(go.Scattergl(
+            x=merges["merged_at"].tolist(),
+            y=merge_y.tolist(),
+            mode="markers",
+            name="PR merged",
+            marker=dict(symbol="triangle-up", size=9, color="orange"),
+            hovertemplate=(
+                "<b>%{x|%Y-%m-%d}</b><br>"
+                "%{customdata}<extra></extra>"
+            ),
+            customdata=merges["pr_label"].tolist(),
+        ))
+
+    fig_loc.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Lines of code (net)",
+        hovermode="x unified",
+        height=460,
+        margin=dict(l=0, r=0, t=10, b=0),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
+    fig_loc.update_yaxes(tickformat=",")
+    return fig_loc
+
+
+@_figure_cache
+def _activity_figures(daily: pd.DataFrame, freq: str, freq_label: str) -> tuple[go.Figure, go.Figure | None]:
+    """Commit velocity bars, plus lines added/removed bars when diff stats exist."""
+    daily_ts = daily.set_index("day")
+
+    # One bucketing pass (over the per-day rollup) for every per-period series in this tab
+    period_aggs = {"count": ("commits", "sum")}
+    if "insertions" in daily.columns:
+        period_aggs["insertions"] = ("insertions", "sum")
+        period_aggs["deletions"] = ("deletions", "sum")
+    agg_ts = (
+        daily_ts.resample(freq)
+        .agg(**period_aggs)
+        .rename_axis("period")
+        .reset_index()
+    )
+
+    fig_vel = px.bar(
+        agg_ts, x="period", y="count",
+        labels={"period": "Date", "count": f"Commits per {freq_label}"},
+    )
+    fig_vel.update_layout(height=320, margin=dict(l=0, r=0, t=10, b=0))
+
+    if "insertions" not in daily.columns:
+        return fig_vel, None
+
+    fig_diff = go.Figure()
+    fig_diff.add_trace(go.Bar(
+        x=agg_ts["period"], y=agg_ts["insertions"],
+        name="Insertions", marker_color="mediumseagreen",
+        hovertemplate="%{x|%Y-%m-%d}<br>+%{y:,}<extra></extra>",
+    ))
+    fig_diff.add_trace(go.Bar(
+        x=agg_ts["period"], y=-agg_ts["deletions"],
+        name="Deletions", marker_color="salmon",
+        hovertemplate="%{x|%Y-%m-%d}<br>-%{y:,}<extra></extra>",
+    ))
+    fig_diff.update_layout(
+        barmode="relative",
+        height=320,
+        margin=dict(l=0, r=0, t=10, b=0),
+        yaxis_title="Lines",
+        xaxis_title="Date",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
+    fig_diff.update_yaxes(tickformat=",")
+    return fig_vel, fig_diff
+
+
+def _commit_density_figure(scatter_df: pd.DataFrame, log_scale: bool) -> go.Figure:
+    """Commit-size chart for dense histories: counts per (date, size) cell.
+
+    The browser receives a fixed-size grid whatever the number of commits.
+    """
+    if log_scale:
+        # Zero-line commits have no place on a log axis (Scattergl drops them too)
+        scatter_df = scatter_df[scatter_df["lines_changed"] > 0]
+        if scatter_df.empty:
+            return go.Figure()
+    x = scatter_df["committed_at"].values.view("i8")
+    y = scatter_df["lines_changed"].to_numpy(dtype=float)
+
+    nx, ny = _SCATTER_BINS
+    x_edges = np.linspace(x.min(), x.max() + 1, nx + 1)
+    if log_scale:
+        y_edges = np.geomspace(max(y.min(), 1.0), y.max() + 1, ny + 1)
+    else:
+        y_edges = np.linspace(y.min(), y.max() + 1, ny + 1)
+    counts, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges])
+    counts = counts.T  # rows = y bins
+
+    # Log colour scale so sparse cells stay visible next to the busy ones;
+    # empty cells are transparent
+    with np.errstate(divide="ignore"):
+        z = np.where(counts > 0, np.log10(counts), np.nan)
+
+    fig_sc = go.Figure(go.Heatmap(
+        x=pd.to_datetime(x_edges.astype("i8"), utc=True),
+        y=y_edges,
+        z=z,
+        customdata=counts,
+        colorscale="Blues",
+        showscale=False,
+        hovertemplate=(
+            "Date=%{x}<br>"
+            "Lines changed=%{y}<br>"
+            "Commits=%{customdata:,}<extra></extra>"
+        ),
+    ))
+    return fig_sc
+
+
+def _commit_scatter_figure(scatter_df: pd.DataFrame) -> go.Figure:
+    scatter_df = scatter_df.assign(message_short=scatter_df["message"].str.split("\n").str[0].str[:80])
+
+    # WebGL scatter, one trace per author (not per point) so big
+    # histories stay responsive
+    fig_sc = go.Figure()
+    for author, group in scatter_df.groupby("author_name", sort=True, observed=True):
+        fig_sc.add_trace(go.Scattergl(
+            x=group["committed_at"].tolist(),
+            y=group["lines_changed"].tolist(),
+            mode="markers",
+            name=author,
+            marker=dict(size=5, opacity=0.7),
+            customdata=group[["short_sha", "message_short", "author_name"]].values.tolist(),
+            hovertemplate=(
+                "Date=%{x}<br>"
+                "Lines changed=%{y}<br>"
+                "short_sha=%{customdata[0]}<br>"
+                "Message=%{customdata[1]}<br>"
+                "Author=%{customdata[2]}<extra></extra>"
+            ),
+        ))
+    return fig_sc
+
+
+@_figure_cache
+def _commit_size_figure(scatter_df: pd.DataFrame, log_scale: bool) -> go.Figure:
+    if len(scatter_df) > _SCATTER_MAX_POINTS:
+        fig_sc = _commit_density_figure(scatter_df, log_scale)
+    else:
+        fig_sc = _commit_scatter_figure(scatter_df)
+    if log_scale:
+        fig_sc.update_yaxes(type="log")
+    fig_sc.update_layout(
+        xaxis_title="Date",
+        height=360,
+        margin=dict(l=0, r=0, t=10, b=0),
+        showlegend=False,
+        yaxis_title="Lines changed (log)" if log_scale else "Lines changed",
+    )
+    return fig_sc
+
+
+@_figure_cache
+def _commit_type_figure(types: pd.Series) -> go.Figure:
+    type_counts = types.value_counts()
+    type_counts = type_counts[type_counts > 0].reset_index()
+    type_counts.columns = ["type", "count"]
+    fig_donut = px.pie(
+        type_counts, names="type", values="count",
+        hole=0.45,
+        color="type",
+        color_discrete_map=COMMIT_TYPE_COLORS,
+    )
+    fig_donut.update_traces(textposition="inside", textinfo="percent+label")
+    fig_donut.update_layout(
+        height=360,
+        margin=dict(l=0, r=0, t=10, b=30),
+        showlegend=True,
+        legend=dict(orientation="v"),
+    )
+    return fig_donut
+
+
+@_figure_cache
+def _leaderboard_figure(author_agg: pd.DataFrame, top_n: int, lb_sort: str) -> go.Figure:
+    top_authors = author_agg.nlargest(top_n, lb_sort).sort_values(lb_sort)
+    fig_lb = px.bar(
+        top_authors,
+        x=lb_sort,
+        y="author_name",
+        orientation="h",
+        labels={"author_name": "", lb_sort: lb_sort.replace("_", " ").title()},
+        text=lb_sort,
+    )
+    fig_lb.update_traces(texttemplate="%{text:,}", textposition="outside")
+    fig_lb.update_layout(
+        height=max(280, top_n * 28),
+        margin=dict(l=0, r=60, t=10, b=0),
+        yaxis=dict(tickfont=dict(size=12)),
+    )
+    return fig_lb
+
+
+@_figure_cache
+def _active_contributors_figure(daily: pd.DataFrame) -> go.Figure:
+    monthly_active = (
+        daily.set_index("day")
+        .resample("ME")["author_name"]
+        .nunique()
+        .reset_index()
+    )
+    monthly_active.columns = ["month", "unique_authors"]
+    fig_active = px.line(
+        monthly_active, x="month", y="unique_authors",
+        markers=True,
+        labels={"month": "Month", "unique_authors": "Unique contributors"},
+    )
+    fig_active.update_layout(height=300, margin=dict(l=0, r=0, t=10, b=0))
+    return fig_active
+
+
+@_figure_cache
+def _author_area_figure(daily_top: pd.DataFrame) -> go.Figure:
+    # Wide month × author grid in one pass; empty months stack as 0
+    wide = daily_top.pivot_table(
+        index=pd.Grouper(key="day", freq="ME"),
+        columns="author_name",
+        values="commits",
+        aggfunc="sum",
+        fill_value=0,
+        observed=True,
+    )
+    # Keep traces (and colours) in order of each author's first active month
+    wide = wide[wide.ne(0).idxmax().sort_values(kind="stable").index]
+    wide.index.name = "month"
+    fig_stack = px.area(
+        wide,
+        labels={"month": "Month", "value": "Commits", "author_name": "Author"},
+    )
+    fig_stack.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=10, b=0),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.4),
+    )
+    return fig_stack
+
+
+@_figure_cache
+def _top_dirs_figure(folders_f: pd.DataFrame, top_dirs_n: int) -> go.Figure:
+    dir_counts = (
+        folders_f.groupby("directory", observed=True)["events"]
+        .sum()
+        .reset_index()
+        .nlargest(top_dirs_n, "events")
+        .sort_values("events")
+    )
+    fig_dirs = px.bar(
+        dir_counts, x="events", y="directory", orientation="h",
+        labels={"directory": "", "events": "Change events"},
+        text="events",
+    )
+    fig_dirs.update_traces(textposition="outside")
+    fig_dirs.update_layout(
+        height=max(300, top_dirs_n * 28),
+        margin=dict(l=0, r=40, t=10, b=0),
+        yaxis=dict(tickfont=dict(size=11)),
+    )
+    return fig_dirs
+
+
+@_figure_cache
+def _heatmap_figure(folders_f: pd.DataFrame, heat_dirs_n: int) -> go.Figure:
+    top_dir_names = (
+        folders_f.groupby("directory", observed=True)["events"].sum()
+        .nlargest(heat_dirs_n).index.tolist()
+    )
+    folders_heat = folders_f[folders_f["directory"].isin(top_dir_names)]
+    # "YYYY-MM" labels straight from the datetime64 values (UTC)
+    month = folders_heat["day"].values.astype("datetime64[M]").astype(str)
+
+    heat_pivot = (
+        folders_heat.groupby(["directory", month], observed=True)["events"]
+        .sum()
+        .unstack(fill_value=0)
+    )
+    heat_pivot = heat_pivot.reindex(sorted(heat_pivot.columns), axis=1)
+    # Long histories: fold months into quarters/years so the grid
+    # sent to the browser stays bounded regardless of the date span
+    heat_period = "Month"
+    for freq_code, period_name in (("Q", "Quarter"), ("Y", "Year")):
+        if heat_pivot.size <= _HEATMAP_MAX_CELLS:
+            break
+        buckets = pd.PeriodIndex(heat_pivot.columns, freq="M").asfreq(freq_code).astype(str)
+        heat_pivot = heat_pivot.T.groupby(buckets).sum().T
+        heat_period = period_name
+
+    fig_heat = px.imshow(
+        heat_pivot,
+        aspect="auto",
+        color_continuous_scale="Blues",
+        labels=dict(x=heat_period, y="Directory", color="Events"),
+    )
+    fig_heat.update_layout(
+        height=max(300, heat_dirs_n * 24),
+        margin=dict(l=0, r=0, t=10, b=0),
+        xaxis=dict(tickangle=-45),
+        coloraxis_showscale=True,
+    )
+    return fig_heat
+
+
+@_figure_cache
+def _pr_sunburst_figure(dir_counts: pd.DataFrame, sun_depth: int) -> go.Figure:
+    """Sunburst of the directories one PR touched, *sun_depth* levels deep."""
+    # Nodes for every directory and its ancestors, leaves coloured
+    # by their dominant change_type
+    all_nodes: dict[str, dict] = _sunburst_nodes(dir_counts, sun_depth).to_dict("index")
+
+    # Parent nodes inherit dominant child change_type. Parents
+    # precede their children, so the children's types are read
+    # before any inheritance, as one snapshot
+    child_types_by_parent: dict[str, set[str]] = defaultdict(set)
+    for info in all_nodes.values():
+        child_types_by_parent[info["parent"]].add(info["change_type"])
+
+    for node, info in all_nodes.items():
+        child_types = child_types_by_parent.get(node)
+        if not child_types:
+            continue  # leaf — already set
+        for ct in ("added", "removed", "renamed", "modified"):
+            if ct in child_types:
+                info["change_type"] = ct
+                break
+
+    # Short integer ids/parents; each full path is sent once, as hover data
+    node_ids = {node: str(i) for i, node in enumerate(all_nodes)}
+    full_paths = list(all_nodes.keys())
+    labels  = [n.split("/")[-1] or n for n in all_nodes]
+    parents = [node_ids.get(v["parent"], "") for v in all_nodes.values()]
+    values  = [v["count"]  for v in all_nodes.values()]
+    colors  = [CHANGE_TYPE_COLORS.get(v["change_type"], "#95a5a6") for v in all_nodes.values()]
+
+    fig_sun = go.Figure(go.Sunburst(
+        labels=labels,
+        parents=parents,
+        values=values,
+        ids=list(node_ids.values()),
+        customdata=full_paths,
+        marker=dict(colors=colors),
+        hovertemplate=(
+            "<b>%{customdata}</b><br>"
+            "Events: %{value}<extra></extra>"
+        ),
+        branchvalues="total",
+    ))
+    fig_sun.update_layout(
+        height=440,
+        margin=dict(l=0, r=0, t=10, b=10),
+    )
+    return fig_sun
+
+
+# ---------------------------------------------------------------------------
+# Table builders for the PR tabs — cached like the figure builders, but the
+# tabs keep slicing the result, so these go through cache_data and every
+# caller gets its own copy.
+# ---------------------------------------------------------------------------
+_table_cache = st.cache_data(max_entries=16, show_spinner=False)
+
+
+@_table_cache
+def _first_added_table(path: str, mtime: float) -> pd.DataFrame:
+    """First 'added' event per directory across the whole report, with its PR.
+
+    Keyed on the report version rather than on the frames themselves, so a
+    hit costs nothing; the frames come from the cached :func:`_build_frames`.
+    """
+    frames = _build_frames(path, mtime)
+    all_folders = frames["folders"]
+    all_merges_full = frames["merges"]
+
+    # Folders are stored in stable committed_at order, so the first row per
+    # directory is its earliest "added" event
+    first_added = (
+        all_folders.loc[all_folders["change_type"] == "added", ["directory", "sha", "committed_at"]]
+        .drop_duplicates(subset=["directory"], keep="first")
+        .reset_index(drop=True)
+    )
+    first_added["directory"] = first_added["directory"].astype(str)
+
+    # Attach PR info via SHA lookup (most debut commits are not merges)
+    first_added = first_added.join(
+        all_merges_full.set_index("merge_commit_sha")[["merged_branch", "pr_number", "message"]],
+        on="sha",
+    )
+    first_added["pr_label"] = (
+        "PR #" + first_added["pr_number"].astype("Int64").astype(str)
+    ).where(first_added["pr_number"].notna(), first_added["sha"])
+
+    first_added = first_added.sort_values("committed_at").reset_index(drop=True)
+    first_added["rank"] = range(len(first_added))
+    dirs = first_added["directory"]
+    first_added["dir_short"] = dirs.where(
+        dirs.str.len() <= 35, "…/" + dirs.str.rsplit("/", n=1).str[-1]
+    )
+    first_added["hover_msg"] = (
+        first_added["message"]
+        .fillna("")
+        .str.split("\n", n=1).str[0]
+        .str[:70]
+    )
+    return first_added
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _frames_by_sha(path: str, mtime: float) -> dict[str, pd.DataFrame]:
+    """Full commits/diff/folders frames indexed by their short SHA, for per-PR lookups.
+
+    Read-only, so cache_resource shares one copy (and its built index) across reruns.
+    """
+    frames = _build_frames(path, mtime)
+    return {
+        "commits": frames["commits"].set_index("short_sha", drop=False).sort_index(kind="stable"),
+        "diff":    frames["diff"].set_index("sha", drop=False).sort_index(kind="stable"),
+        "folders": frames["folders"].set_index("sha", drop=False).sort_index(kind="stable"),
+    }
+
+
+def _rows_for_sha(df_by_sha: pd.DataFrame, sha: str) -> pd.DataFrame:
+    """All rows of a SHA-indexed frame for *sha* (empty if there are none)."""
+    try:
+        return df_by_sha.loc[[sha]]
+    except KeyError:
+        return df_by_sha.iloc[:0]
+
+
+@_table_cache
+def _pr_dir_counts(path: str, mtime: float, sha: str) -> pd.DataFrame:
+    """Folder-change events per (directory, change_type) for one merge commit."""
+    pr_dirs = _rows_for_sha(_frames_by_sha(path, mtime)["folders"], sha)
+    return (
+        pr_dirs.groupby(["directory", "change_type"], sort=False, observed=True)
+        .size()
+        .reset_index(name="count")
+    )
+
+
+@_table_cache
+def _pr_size_frame(path: str, mtime: float, merges: pd.DataFrame) -> pd.DataFrame:
+    """Merged PRs with their diff stats, keeping only those that changed lines.
+
+    A merge commit's diff row shares its merged_at, so probing the
+    report-wide SHA index finds the same rows as the date-filtered diffs.
+    """
+    diff_by_sha = _frames_by_sha(path, mtime)["diff"]
+    pr_size = merges.join(
+        diff_by_sha[["insertions", "deletions", "files_changed"]],
+        on="merge_commit_sha",
+    )
+    pr_size["lines_changed"] = pr_size["insertions"].fillna(0) + pr_size["deletions"].fillna(0)
+    pr_size["message_short"] = pr_size["message"].str.split("\n", n=1).str[0].str[:80]
+    return pr_size[pr_size["lines_changed"] > 0]
+
+
+@_table_cache
+def _pr_table(merges: pd.DataFrame) -> pd.DataFrame:
+    """Merged-PR table rows, newest first, with display-formatted columns."""
+    pr_display = merges.iloc[::-1].reset_index(drop=True)
+    pr_display["merged_at"] = pr_display["merged_at"].dt.strftime("%Y-%m-%d")
+    pr_display["message"] = pr_display["message"].str.split("\n", n=1).str[0].str[:100]
+    pr_display.columns = [c.replace("_", " ").title() for c in pr_display.columns]
+    return pr_display
+
+
 # ---------------------------------------------------------------------------
 # Sidebar — load report
 # ---------------------------------------------------------------------------
@@ -107,7 +949,9 @@ default_report = Path(__file__).parent / "report.json"
 report_path = st.sidebar.text_input("Report file", value=str(default_report))
 
 try:
-    report = load_report(report_path)
+    report_mtime = Path(report_path).stat().st_mtime
+    report = load_report(report_path, report_mtime)
+    frames = _build_frames(report_path, report_mtime)
 except FileNotFoundError:
     st.error(f"Report not found: `{report_path}`\n\nRun `python main.py all` to generate it.")
     st.stop()
@@ -122,28 +966,19 @@ st.sidebar.divider()
 # Build base DataFrames (unfiltered) so we can derive the slider bounds
 # ---------------------------------------------------------------------------
 
-df_commits = pd.DataFrame(report.get("commit_log", []))
-df_merges  = pd.DataFrame(report.get("merges", []))
-df_folders = pd.DataFrame(report.get("folder_changes", []))
-df_diff    = pd.DataFrame(report.get("diff_stats", {}).get("per_commit", []))
-df_loc     = pd.DataFrame(report.get("loc_over_time", []))
-
-for df, col in [
-    (df_commits, "committed_at"),
-    (df_merges,  "merged_at"),
-    (df_folders, "committed_at"),
-    (df_diff,    "committed_at"),
-    (df_loc,     "committed_at"),
-]:
-    if not df.empty and col in df.columns:
-        df[col] = pd.to_datetime(df[col], utc=True)
+df_commits = frames["commits"]
+df_merges  = frames["merges"]
+df_folders = frames["folders"]
+df_diff    = frames["diff"]
+df_loc     = frames["loc"]
+df_commits_daily = frames["commits_daily"]
+df_folders_daily = frames["folders_daily"]
 
 # Derive global date bounds from commits
 if df_commits.empty:
     st.error("No commit data in report.")
     st.stop()
 
-df_commits = df_commits.sort_values("committed_at")
 global_min = df_commits["committed_at"].min().to_pydatetime().date()
 global_max = df_commits["committed_at"].max().to_pydatetime().date()
 
@@ -164,7 +999,8 @@ start_date, end_date = date_range
 # ---------------------------------------------------------------------------
 # Sidebar — exclude authors
 # ---------------------------------------------------------------------------
-all_authors = sorted({a["author_name"] for a in report.get("authors", [{}])[0].get("authors", [])})
+# The categorical built once in _build_frames already holds the sorted, unique names
+all_authors = df_commits["author_name"].cat.categories.tolist()
 excluded = st.sidebar.multiselect("Exclude authors", options=all_authors, default=[])
 
 st.sidebar.divider()
@@ -173,30 +1009,36 @@ st.sidebar.caption(f"Data window: {start_date} → {end_date}")
 # ---------------------------------------------------------------------------
 # Apply global filters
 # ---------------------------------------------------------------------------
-def _date_mask(df: pd.DataFrame, col: str) -> pd.Series:
-    s = pd.Timestamp(start_date, tz="UTC")
-    e = pd.Timestamp(end_date,   tz="UTC") + pd.Timedelta(days=1)
-    return (df[col] >= s) & (df[col] < e)
+# Every frame is sorted by its time column, so the date window is a
+# contiguous row range found by binary search on the ns-epoch values.
+_lo, _hi = (
+    np.array([start_date, end_date + timedelta(days=1)], dtype="datetime64[D]")
+    .astype("datetime64[ns]")
+    .view("i8")
+)
 
-def _author_mask(df: pd.DataFrame, col: str = "author_name") -> pd.Series:
+def _date_slice(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    if df.empty:
+        return df
+    i0, i1 = np.searchsorted(df[col].values.view("i8"), [_lo, _hi])
+    return df.iloc[i0:i1]
+
+def _author_mask(df: pd.DataFrame, col: str = "author_name") -> np.ndarray:
+    # Compares integer category codes, so no per-row string hashing
     if not excluded or col not in df.columns:
-        return pd.Series(True, index=df.index)
-    return ~df[col].isin(excluded)
-
-commits  = df_commits[_date_mask(df_commits, "committed_at") & _author_mask(df_commits)].copy() if not df_commits.empty else df_commits
-merges   = df_merges[ _date_mask(df_merges,  "merged_at")]  .copy() if not df_merges.empty  else df_merges
-folders  = df_folders[_date_mask(df_folders, "committed_at")].copy() if not df_folders.empty else df_folders
-diffs    = df_diff[   _date_mask(df_diff,    "committed_at")].copy() if not df_diff.empty    else df_diff
-loc      = df_loc[    _date_mask(df_loc,     "committed_at")].copy() if not df_loc.empty     else df_loc
-
-# Enrich commits with diff stats
-if not commits.empty and not diffs.empty:
-    commits = commits.merge(
-        diffs[["sha", "insertions", "deletions", "files_changed"]].rename(columns={"sha": "short_sha"}),
-        on="short_sha", how="left",
-    )
-    commits["lines_changed"] = commits["insertions"].fillna(0) + commits["deletions"].fillna(0)
-    commits["commit_type"] = commits["message"].apply(commit_type)
+        return np.ones(len(df), dtype=bool)
+    authors = df[col].cat
+    return ~np.isin(authors.codes.to_numpy(), authors.categories.get_indexer(excluded))
+
+commits  = _date_slice(df_commits, "committed_at")
+commits  = commits[_author_mask(commits)] if excluded else commits
+merges   = _date_slice(df_merges,  "merged_at")
+folders  = _date_slice(df_folders, "committed_at")
+diffs    = _date_slice(df_diff,    "committed_at")
+loc      = _date_slice(df_loc,     "committed_at")
+commits_daily = _date_slice(df_commits_daily, "day")
+commits_daily = commits_daily[_author_mask(commits_daily)] if excluded else commits_daily
+folders_daily = _date_slice(df_folders_daily, "day")
 
 # ---------------------------------------------------------------------------
 # Page title
@@ -240,78 +1082,18 @@ with tab1:
     if loc.empty:
         st.info("No LOC data for this range.")
     else:
-        loc_sorted = loc.sort_values("committed_at")
-
         smooth = st.toggle("Smooth curve (rolling average)", value=False, key="loc_smooth")
-        if smooth:
-            win = st.slider("Rolling window (commits)", 5, 100, 20, 5, key="loc_win")
-            loc_sorted["plot_loc"] = loc_sorted["cumulative_loc"].rolling(win, min_periods=1).mean()
-        else:
-            loc_sorted["plot_loc"] = loc_sorted["cumulative_loc"]
+        win = st.slider("Rolling window (commits)", 5, 100, 20, 5, key="loc_win") if smooth else None
 
         show_merges = st.toggle("Show PR merge markers", value=True, key="loc_merges")
+        merge_cols = [c for c in ("merged_at", "pr_label") if c in merges.columns]
 
-        fig_loc = go.Figure()
-        fig_loc.add_trace(go.Scatter(
-            x=loc_sorted["committed_at"],
-            y=loc_sorted["plot_loc"],
-            mode="lines",
-            name="Cumulative LOC",
-            line=dict(width=2),
-            hovertemplate=(
-                "<b>%{x|%Y-%m-%d}</b><br>"
-                "LOC: %{y:,.0f}<br>"
-                "SHA: %{customdata}<extra></extra>"
-            ),
-            customdata=loc_sorted["sha"],
-        ))
-
-        if show_merges and not merges.empty:
-            # Overlay merge events as scatter markers on the LOC line
-            merge_locs = pd.merge_asof(
-                merges.sort_values("merged_at"),
-                loc_sorted[["committed_at", "plot_loc"]].rename(columns={"committed_at": "merged_at"}),
-                on="merged_at",
-                direction="nearest",
-            )
-            # Build hover label: "PR #NNN — first line of message (clipped to 60 chars)"
-            pr_number_str = (
-                "PR #" + merge_locs["pr_number"].astype("Int64").astype(str)
-                if "pr_number" in merge_locs.columns
-                else merge_locs["merged_branch"]
-            )
-            pr_title = (
-                merge_locs["message"]
-                .str.split("\n").str[0]          # first line only
-                .str.replace(r"\s*\(#\d+\)\s*$", "", regex=True)  # strip trailing (#NNN)
-                .str.strip()
-                .str[:60]
-            )
-            pr_labels = pr_number_str + " — " + pr_title
-
-            fig_loc.add_trace(go.Scatter(
-                x=merge_locs["merged_at"],
-                y=merge_locs["plot_loc"],
-                mode="markers",
-                name="PR merged",
-                marker=dict(symbol="triangle-up", size=9, color="orange"),
-                hovertemplate=(
-                    "<b>%{x|%Y-%m-%d}</b><br>"
-                    "%{customdata}<extra></extra>"
-                ),
-                customdata=pr_labels,
-            ))
-
-        fig_loc.update_layout(
-            xaxis_title="Date",
-            yaxis_title="Lines of code (net)",
-            hovermode="x unified",
-            height=460,
-            margin=dict(l=0, r=0, t=10, b=0),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        fig_loc = _loc_figure(
+            loc[["sha", "committed_at", "cumulative_loc"]],
+            merges[merge_cols] if show_merges and not merges.empty else None,
+            win,
         )
-        fig_loc.update_yaxes(tickformat=",")
-        st.plotly_chart(fig_loc, use_container_width=True)
+        st.plotly_chart(fig_loc, use_container_width=True, key="loc_chart")
 
 
 # ============================================================
@@ -325,49 +1107,17 @@ with tab2:
         freq = "W" if period_choice == "Week" else "ME"
         freq_label = "week" if period_choice == "Week" else "month"
 
-        commits_ts = commits.set_index("committed_at")
+        activity_cols = [c for c in ("day", "commits", "insertions", "deletions") if c in commits_daily.columns]
+        fig_vel, fig_diff = _activity_figures(commits_daily[activity_cols], freq, freq_label)
 
         # --- Commit velocity ---
         st.subheader("Commit velocity")
-        velocity = commits_ts.resample(freq).size().reset_index(name="count")
-        velocity.columns = ["period", "count"]
-        fig_vel = px.bar(
-            velocity, x="period", y="count",
-            labels={"period": "Date", "count": f"Commits per {freq_label}"},
-        )
-        fig_vel.update_layout(height=320, margin=dict(l=0, r=0, t=10, b=0))
-        st.plotly_chart(fig_vel, use_container_width=True)
+        st.plotly_chart(fig_vel, use_container_width=True, key="velocity_chart")
 
         # --- Lines added vs removed ---
         st.subheader("Lines added vs removed")
-        if "insertions" in commits.columns:
-            diff_ts = commits_ts[["insertions", "deletions"]].fillna(0)
-            ins_agg  = diff_ts["insertions"].resample(freq).sum().reset_index()
-            dels_agg = diff_ts["deletions"].resample(freq).sum().reset_index()
-            ins_agg.columns  = ["period", "value"]
-            dels_agg.columns = ["period", "value"]
-
-            fig_diff = go.Figure()
-            fig_diff.add_trace(go.Bar(
-                x=ins_agg["period"], y=ins_agg["value"],
-                name="Insertions", marker_color="mediumseagreen",
-                hovertemplate="%{x|%Y-%m-%d}<br>+%{y:,}<extra></extra>",
-            ))
-            fig_diff.add_trace(go.Bar(
-                x=dels_agg["period"], y=-dels_agg["value"],
-                name="Deletions", marker_color="salmon",
-                hovertemplate="%{x|%Y-%m-%d}<br>-%{y:,}<extra></extra>",
-            ))
-            fig_diff.update_layout(
-                barmode="relative",
-                height=320,
-                margin=dict(l=0, r=0, t=10, b=0),
-                yaxis_title="Lines",
-                xaxis_title="Date",
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            )
-            fig_diff.update_yaxes(tickformat=",")
-            st.plotly_chart(fig_diff, use_container_width=True)
+        if fig_diff is not None:
+            st.plotly_chart(fig_diff, use_container_width=True, key="diff_chart")
         else:
             st.info("Diff stats not available for this range.")
 
@@ -378,27 +1128,11 @@ with tab2:
             st.subheader("Commit size")
             if "lines_changed" in commits.columns:
                 log_scale = st.toggle("Log scale (y-axis)", value=False, key="scatter_log")
-                scatter_df = commits[["committed_at", "lines_changed", "author_name", "short_sha", "message"]].copy()
-                scatter_df["message_short"] = scatter_df["message"].str.split("\n").str[0].str[:80]
-                fig_sc = px.scatter(
-                    scatter_df,
-                    x="committed_at",
-                    y="lines_changed",
-                    color="author_name",
-                    log_y=log_scale,
-                    hover_data={"committed_at": True, "lines_changed": True,
-                                "short_sha": True, "message_short": True, "author_name": True},
-                    labels={"committed_at": "Date", "lines_changed": "Lines changed",
-                            "author_name": "Author", "message_short": "Message"},
+                fig_sc = _commit_size_figure(
+                    commits[["committed_at", "lines_changed", "author_name", "short_sha", "message"]],
+                    log_scale,
                 )
-                fig_sc.update_traces(marker=dict(size=5, opacity=0.7))
-                fig_sc.update_layout(
-                    height=360,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    showlegend=False,
-                    yaxis_title="Lines changed (log)" if log_scale else "Lines changed",
-                )
-                st.plotly_chart(fig_sc, use_container_width=True)
+                st.plotly_chart(fig_sc, use_container_width=True, key="scatter_chart")
             else:
                 st.info("Diff stats not available.")
 
@@ -406,22 +1140,8 @@ with tab2:
         with col_donut:
             st.subheader("Commit types")
             if "commit_type" in commits.columns:
-                type_counts = commits["commit_type"].value_counts().reset_index()
-                type_counts.columns = ["type", "count"]
-                fig_donut = px.pie(
-                    type_counts, names="type", values="count",
-                    hole=0.45,
-                    color="type",
-                    color_discrete_map=COMMIT_TYPE_COLORS,
-                )
-                fig_donut.update_traces(textposition="inside", textinfo="percent+label")
-                fig_donut.update_layout(
-                    height=360,
-                    margin=dict(l=0, r=0, t=10, b=30),
-                    showlegend=True,
-                    legend=dict(orientation="v"),
-                )
-                st.plotly_chart(fig_donut, use_container_width=True)
+                fig_donut = _commit_type_figure(commits["commit_type"])
+                st.plotly_chart(fig_donut, use_container_width=True, key="types_chart")
             else:
                 st.info("Commit type data not available.")
 
@@ -436,7 +1156,7 @@ with tab3:
         # Build per-author aggregates from filtered commits
         if "insertions" in commits.columns:
             author_agg = (
-                commits.groupby("author_name")
+                commits.groupby("author_name", observed=True)
                 .agg(
                     commit_count=("short_sha", "count"),
                     lines_added=("insertions", "sum"),
@@ -447,7 +1167,7 @@ with tab3:
             )
         else:
             author_agg = (
-                commits.groupby("author_name")
+                commits.groupby("author_name", observed=True)
                 .agg(commit_count=("short_sha", "count"))
                 .reset_index()
                 .assign(lines_added=0, lines_removed=0, net_lines=0)
@@ -464,23 +1184,9 @@ with tab3:
                                                        "net_lines": "Net lines"}[x],
                                key="lb_sort")
 
-        top_authors = author_agg.nlargest(top_n, lb_sort).sort_values(lb_sort)
         with col_lb:
-            fig_lb = px.bar(
-                top_authors,
-                x=lb_sort,
-                y="author_name",
-                orientation="h",
-                labels={"author_name": "", lb_sort: lb_sort.replace("_", " ").title()},
-                text=lb_sort,
-            )
-            fig_lb.update_traces(texttemplate="%{text:,}", textposition="outside")
-            fig_lb.update_layout(
-                height=max(280, top_n * 28),
-                margin=dict(l=0, r=60, t=10, b=0),
-                yaxis=dict(tickfont=dict(size=12)),
-            )
-            st.plotly_chart(fig_lb, use_container_width=True)
+            fig_lb = _leaderboard_figure(author_agg, top_n, lb_sort)
+            st.plotly_chart(fig_lb, use_container_width=True, key="lb_chart")
 
         st.divider()
 
@@ -489,46 +1195,20 @@ with tab3:
         # --- Active contributors per month ---
         with col_monthly:
             st.subheader("Active contributors per month")
-            monthly_active = (
-                commits.set_index("committed_at")
-                .resample("ME")["author_name"]
-                .nunique()
-                .reset_index()
-            )
-            monthly_active.columns = ["month", "unique_authors"]
-            fig_active = px.line(
-                monthly_active, x="month", y="unique_authors",
-                markers=True,
-                labels={"month": "Month", "unique_authors": "Unique contributors"},
-            )
-            fig_active.update_layout(height=300, margin=dict(l=0, r=0, t=10, b=0))
-            st.plotly_chart(fig_active, use_container_width=True)
+            fig_active = _active_contributors_figure(commits_daily[["day", "author_name"]])
+            st.plotly_chart(fig_active, use_container_width=True, key="active_chart")
 
         # --- Per-author stacked area ---
         with col_stack:
             st.subheader("Commits per author over time")
             top_author_names = author_agg.nlargest(8, "commit_count")["author_name"].tolist()
-            commits_top = commits[commits["author_name"].isin(top_author_names)].copy()
-
-            if not commits_top.empty:
-                monthly_by_author = (
-                    commits_top.set_index("committed_at")
-                    .groupby([pd.Grouper(freq="ME"), "author_name"])
-                    .size()
-                    .reset_index(name="count")
-                )
-                monthly_by_author.columns = ["month", "author_name", "count"]
-                fig_stack = px.area(
-                    monthly_by_author,
-                    x="month", y="count", color="author_name",
-                    labels={"month": "Month", "count": "Commits", "author_name": "Author"},
-                )
-                fig_stack.update_layout(
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    legend=dict(orientation="h", yanchor="bottom", y=-0.4),
-                )
-                st.plotly_chart(fig_stack, use_container_width=True)
+            daily_top = commits_daily.loc[
+                commits_daily["author_name"].isin(top_author_names), ["day", "author_name", "commits"]
+            ]
+
+            if not daily_top.empty:
+                fig_stack = _author_area_figure(daily_top)
+                st.plotly_chart(fig_stack, use_container_width=True, key="stack_chart")
             else:
                 st.info("Not enough data.")
 
@@ -546,7 +1226,11 @@ with tab4:
             "Change types", options=change_types_available,
             default=change_types_available, key="folder_types",
         )
-        folders_f = folders[folders["change_type"].isin(selected_types)] if selected_types else folders
+        folders_f = (
+            folders_daily[folders_daily["change_type"].isin(selected_types)]
+            if selected_types else folders_daily
+        )
+        folders_f = folders_f[["directory", "day", "events"]]
 
         col_bar, col_heat = st.columns([1, 2])
 
@@ -554,58 +1238,15 @@ with tab4:
         with col_bar:
             st.subheader("Top directories by churn")
             top_dirs_n = st.slider("Top N directories", 5, 30, 15, key="dirs_n")
-            dir_counts = (
-                folders_f.groupby("directory")
-                .size()
-                .reset_index(name="events")
-                .nlargest(top_dirs_n, "events")
-                .sort_values("events")
-            )
-            fig_dirs = px.bar(
-                dir_counts, x="events", y="directory", orientation="h",
-                labels={"directory": "", "events": "Change events"},
-                text="events",
-            )
-            fig_dirs.update_traces(textposition="outside")
-            fig_dirs.update_layout(
-                height=max(300, top_dirs_n * 28),
-                margin=dict(l=0, r=40, t=10, b=0),
-                yaxis=dict(tickfont=dict(size=11)),
-            )
-            st.plotly_chart(fig_dirs, use_container_width=True)
+            fig_dirs = _top_dirs_figure(folders_f, top_dirs_n)
+            st.plotly_chart(fig_dirs, use_container_width=True, key="dirs_chart")
 
         # --- Directory × month heatmap ---
         with col_heat:
             st.subheader("Directory activity heatmap")
             heat_dirs_n = st.slider("Directories in heatmap", 5, 50, 15, key="heat_n")
-
-            top_dir_names = (
-                folders_f.groupby("directory").size()
-                .nlargest(heat_dirs_n).index.tolist()
-            )
-            folders_heat = folders_f[folders_f["directory"].isin(top_dir_names)].copy()
-            folders_heat["month"] = folders_heat["committed_at"].dt.to_period("M").astype(str)
-
-            heat_pivot = (
-                folders_heat.groupby(["directory", "month"])
-                .size()
-                .reset_index(name="events")
-                .pivot(index="directory", columns="month", values="events")
-                .fillna(0)
-            )
-            fig_heat = px.imshow(
-                heat_pivot,
-                aspect="auto",
-                color_continuous_scale="Blues",
-                labels=dict(x="Month", y="Directory", color="Events"),
-            )
-            fig_heat.update_layout(
-                height=max(300, heat_dirs_n * 24),
-                margin=dict(l=0, r=0, t=10, b=0),
-                xaxis=dict(tickangle=-45),
-                coloraxis_showscale=True,
-            )
-            st.plotly_chart(fig_heat, use_container_width=True)
+            fig_heat = _heatmap_figure(folders_f, heat_dirs_n)
+            st.plotly_chart(fig_heat, use_container_width=True, key="heat_chart")
 
 
 # ============================================================
@@ -615,43 +1256,43 @@ with tab5:
     if merges.empty or folders.empty:
         st.info("Need both merge events and folder change data to use this tab.")
     else:
-        # Build PR list for the slider: merges sorted chronologically, title clipped
-        pr_list = (
-            merges.sort_values("merged_at")
-            .assign(
-                pr_title=lambda d: (
-                    "PR #" + d["pr_number"].astype("Int64").astype(str) + "  —  "
-                    + d["message"].str.split("\n").str[0]
-                      .str.replace(r"\s*\(#\d+\)\s*$", "", regex=True)
-                      .str.strip()
-                      .str[:60]
-                )
-            )
-            .reset_index(drop=True)
-        )
+        # PR list for the slider: merges are already in chronological order
+        # and their clipped titles are built once per report
+        pr_list = merges[["merge_commit_sha", "merged_at", "merged_branch", "pr_title", "message"]].reset_index(drop=True)
 
         if pr_list.empty:
             st.info("No PRs in the selected date range.")
         else:
             # ── PR selector ──────────────────────────────────────────
+            # Inside a form, dragging/arrowing through PRs does not rerun the
+            # script; the heavy per-PR rendering below only runs on submit
             pr_titles = pr_list["pr_title"].tolist()
-            selected_title = st.select_slider(
-                "Browse PRs (oldest → newest)",
-                options=pr_titles,
-                value=pr_titles[-1],
-                key="pr_explorer_slider",
-            )
-            selected_pr = pr_list[pr_list["pr_title"] == selected_title].iloc[0]
+            with st.form("pr_explorer_form", border=False):
+                selected_title = st.select_slider(
+                    "Browse PRs (oldest → newest)",
+                    options=pr_titles,
+                    value=pr_titles[-1],
+                    key="pr_explorer_slider",
+                )
+                st.form_submit_button("Show PR")
+            selected_pr = pr_list.iloc[pr_titles.index(selected_title)]
             selected_sha = selected_pr["merge_commit_sha"]
 
             # ── Enrich with diff stats and author ────────────────────
-            pr_diff = diffs[diffs["sha"] == selected_sha]
+            # The merge commit's own rows share its timestamp, so lookups on
+            # the full (SHA-indexed) frames stay inside the date window
+            by_sha = _frames_by_sha(report_path, report_mtime)
+            pr_diff = _rows_for_sha(by_sha["diff"], selected_sha)
             pr_ins   = int(pr_diff["insertions"].sum()) if not pr_diff.empty else None
             pr_dels  = int(pr_diff["deletions"].sum())  if not pr_diff.empty else None
             pr_files = int(pr_diff["files_changed"].sum()) if not pr_diff.empty else None
 
-            pr_author_row = commits[commits["short_sha"] == selected_sha]
-            pr_author = pr_author_row["author_name"].iloc[0] if not pr_author_row.empty else "—"
+            pr_author_row = _rows_for_sha(by_sha["commits"], selected_sha)
+            pr_author = (
+                pr_author_row["author_name"].iloc[0]
+                if not pr_author_row.empty and pr_author_row["author_name"].iloc[0] not in excluded
+                else "—"
+            )
 
             pr_type = commit_type(selected_pr["message"])
             type_color = COMMIT_TYPE_COLORS.get(pr_type, "#95a5a6")
@@ -693,122 +1334,38 @@ with tab5:
             st.divider()
 
             # ── Per-PR folder changes ─────────────────────────────────
-            pr_dirs = folders[folders["sha"] == selected_sha].copy()
+            # Events per (directory, change_type), shared by the sunburst and
+            # the summary table
+            dir_counts = _pr_dir_counts(report_path, report_mtime, selected_sha)
 
             col_sun, col_table, col_msg = st.columns([3, 2, 2])
 
             with col_sun:
                 st.subheader("Directories touched")
-                if pr_dirs.empty:
+                if dir_counts.empty:
                     st.info("No folder-level changes recorded for this PR.")
                 else:
-                    # Build sunburst: split each path into parts and build
-                    # parent/label/value/color lists for Plotly
-                    _color_map = {
-                        "added":    "#2ecc71",
-                        "modified": "#3498db",
-                        "removed":  "#e74c3c",
-                        "renamed":  "#f39c12",
-                    }
-
-                    # Count events per (directory, change_type)
-                    dir_counts = (
-                        pr_dirs.groupby(["directory", "change_type"])
-                        .size()
-                        .reset_index(name="count")
-                    )
-
-                    # Determine dominant change_type per directory for colouring
-                    dominant = (
-                        dir_counts.sort_values("count", ascending=False)
-                        .groupby("directory")
-                        .first()
-                        .reset_index()[["directory", "change_type"]]
-                    )
-
-                    # Build sunburst node lists
-                    # Each path like "a/b/c" gives nodes: "a", "a/b", "a/b/c"
-                    # with parent "", "a", "a/b" respectively
-                    all_nodes: dict[str, dict] = {}  # path → {parent, count, change_type}
-
-                    for _, row in dir_counts.iterrows():
-                        parts = row["directory"].split("/")
-                        for depth in range(1, len(parts) + 1):
-                            node  = "/".join(parts[:depth])
-                            parent = "/".join(parts[:depth - 1]) if depth > 1 else ""
-                            if node not in all_nodes:
-                                all_nodes[node] = {"parent": parent, "count": 0, "change_type": "modified"}
-                            all_nodes[node]["count"] += row["count"]
-
-                    # Overwrite change_type with dominant for leaf nodes
-                    for _, row in dominant.iterrows():
-                        if row["directory"] in all_nodes:
-                            all_nodes[row["directory"]]["change_type"] = row["change_type"]
-
-                    # Parent nodes inherit dominant child change_type
-                    for node, info in all_nodes.items():
-                        if not any(v["parent"] == node for v in all_nodes.values()):
-                            continue  # leaf — already set
-                        child_types = [
-                            v["change_type"] for k, v in all_nodes.items()
-                            if v["parent"] == node
-                        ]
-                        if child_types:
-                            for ct in ("added", "removed", "renamed", "modified"):
-                                if ct in child_types:
-                                    all_nodes[node]["change_type"] = ct
-                                    break
-
-                    labels  = [n.split("/")[-1] or n for n in all_nodes]
-                    parents = [v["parent"] for v in all_nodes.values()]
-                    values  = [v["count"]  for v in all_nodes.values()]
-                    colors  = [_color_map.get(v["change_type"], "#95a5a6") for v in all_nodes.values()]
-                    full_paths = list(all_nodes.keys())
-
-                    fig_sun = go.Figure(go.Sunburst(
-                        labels=labels,
-                        parents=parents,
-                        values=values,
-                        ids=full_paths,
-                        marker=dict(colors=colors),
-                        hovertemplate=(
-                            "<b>%{id}</b><br>"
-                            "Events: %{value}<extra></extra>"
-                        ),
-                        branchvalues="total",
-                        maxdepth=4,
-                    ))
-                    fig_sun.update_layout(
-                        height=440,
-                        margin=dict(l=0, r=0, t=10, b=10),
-                    )
+                    # Only the levels on screen are generated and sent to the
+                    # browser; Plotly's maxdepth would still ship the whole tree
+                    sun_depth = st.slider("Sunburst depth", 1, 5, 2, key="sun_depth")
+                    fig_sun = _pr_sunburst_figure(dir_counts, sun_depth)
 
                     # Legend
                     leg_cols = st.columns(4)
-                    for i, (ct, col_hex) in enumerate(_color_map.items()):
+                    for i, (ct, col_hex) in enumerate(CHANGE_TYPE_COLORS.items()):
                         leg_cols[i].markdown(
                             f"<span style='color:{col_hex}'>■</span> {ct.capitalize()}",
                             unsafe_allow_html=True,
                         )
 
-                    st.plotly_chart(fig_sun, use_container_width=True)
+                    st.plotly_chart(fig_sun, use_container_width=True, key="sun_chart")
 
             with col_table:
                 st.subheader("Change summary")
-                summary = (
-                    pr_dirs.groupby(["directory", "change_type"])
-                    .size()
-                    .reset_index(name="events")
-                    .sort_values(["change_type", "events"], ascending=[True, False])
-                )
+                summary = dir_counts.sort_values(["change_type", "count"], ascending=[True, False])
                 summary.columns = ["Directory", "Change type", "Events"]
-                def _style_type(val: str) -> str:
-                    c = {"added": "#2ecc71", "modified": "#3498db",
-                         "removed": "#e74c3c", "renamed": "#f39c12"}.get(val, "")
-                    return f"color: {c}; font-weight: bold" if c else ""
-
                 st.dataframe(
-                    summary.style.applymap(_style_type, subset=["Change type"]),
+                    summary.style.apply(_bold_color_css, colors=CHANGE_TYPE_COLORS, subset=["Change type"]),
                     use_container_width=True,
                     hide_index=True,
                     height=420,
@@ -831,41 +1388,7 @@ with tab5:
 
             # Find first "added" event per directory across ALL folder data (not just date-filtered)
             # so we always show the true birth even if it's outside the current window
-            all_folders = pd.DataFrame(report.get("folder_changes", []))
-            all_folders["committed_at"] = pd.to_datetime(all_folders["committed_at"], utc=True)
-            all_merges_full = pd.DataFrame(report.get("merges", []))
-            all_merges_full["merged_at"] = pd.to_datetime(all_merges_full["merged_at"], utc=True)
-
-            first_added = (
-                all_folders[all_folders["change_type"] == "added"]
-                .sort_values("committed_at")
-                .groupby("directory")
-                .first()
-                .reset_index()[["directory", "sha", "committed_at"]]
-            )
-
-            # Attach PR info via SHA match
-            first_added = first_added.merge(
-                all_merges_full[["merge_commit_sha", "merged_branch", "pr_number", "message"]]
-                    .rename(columns={"merge_commit_sha": "sha"}),
-                on="sha",
-                how="left",
-            )
-            first_added["pr_label"] = (
-                "PR #" + first_added["pr_number"].astype("Int64").astype(str)
-            ).where(first_added["pr_number"].notna(), first_added["sha"])
-
-            first_added = first_added.sort_values("committed_at").reset_index(drop=True)
-            first_added["rank"] = range(len(first_added))
-            first_added["dir_short"] = first_added["directory"].apply(
-                lambda d: d if len(d) <= 35 else "…/" + d.split("/")[-1]
-            )
-            first_added["hover_msg"] = (
-                first_added["message"]
-                .fillna("")
-                .str.split("\n").str[0]
-                .str[:70]
-            )
+            first_added = _first_added_table(report_path, report_mtime)
 
             # Limit to top-level depth control
             max_depth = st.slider(
@@ -903,7 +1426,7 @@ with tab5:
                     margin=dict(l=0, r=220, t=10, b=0),
                     showlegend=False,
                 )
-                st.plotly_chart(fig_debut, use_container_width=True)
+                st.plotly_chart(fig_debut, use_container_width=True, key="debut_chart")
 
 
 # ============================================================
@@ -929,7 +1452,7 @@ with tab6:
                     margin=dict(l=0, r=0, t=10, b=10),
                     showlegend=False,
                 )
-                st.plotly_chart(fig_style, use_container_width=True)
+                st.plotly_chart(fig_style, use_container_width=True, key="style_chart")
 
         with col_freq:
             st.subheader("PRs merged over time")
@@ -949,22 +1472,17 @@ with tab6:
                 labels={"period": "Date", "count": f"PRs per {pr_freq_label}"},
             )
             fig_pr.update_layout(height=260, margin=dict(l=0, r=0, t=10, b=0))
-            st.plotly_chart(fig_pr, use_container_width=True)
+            st.plotly_chart(fig_pr, use_container_width=True, key="pr_chart")
 
         st.divider()
 
         # --- PR size scatter ---
         st.subheader("PR size (lines changed)")
-        if not diffs.empty and "sha" in merges.columns:
-            pr_size = merges.merge(
-                diffs[["sha", "insertions", "deletions", "files_changed"]],
-                left_on="merge_commit_sha",
-                right_on="sha",
-                how="left",
+        if not diffs.empty and "merge_commit_sha" in merges.columns:
+            pr_size_valid = _pr_size_frame(
+                report_path, report_mtime,
+                merges[["merge_commit_sha", "merged_at", "message"]],
             )
-            pr_size["lines_changed"] = pr_size["insertions"].fillna(0) + pr_size["deletions"].fillna(0)
-            pr_size["message_short"] = pr_size["message"].str.split("\n").str[0].str[:80]
-            pr_size_valid = pr_size[pr_size["lines_changed"] > 0].copy()
 
             if not pr_size_valid.empty:
                 fig_pr_sc = px.scatter(
@@ -989,7 +1507,7 @@ with tab6:
                     height=360,
                     margin=dict(l=0, r=0, t=10, b=0),
                 )
-                st.plotly_chart(fig_pr_sc, use_container_width=True)
+                st.plotly_chart(fig_pr_sc, use_container_width=True, key="pr_size_chart")
             else:
                 st.info("Could not match diff stats to merge commits for this range.")
         else:
@@ -999,10 +1517,7 @@ with tab6:
         st.subheader("Merged PRs")
         pr_table_cols = [c for c in ["merge_commit_sha", "merged_at", "merged_branch", "merge_style", "message"]
                          if c in merges.columns]
-        pr_display = merges[pr_table_cols].copy()
-        pr_display["merged_at"] = pr_display["merged_at"].dt.strftime("%Y-%m-%d")
-        pr_display["message"] = pr_display["message"].str.split("\n").str[0].str[:100]
-        pr_display.columns = [c.replace("_", " ").title() for c in pr_display.columns]
+        pr_display = _pr_table(merges[pr_table_cols])
         st.dataframe(pr_display, use_container_width=True, hide_index=True)
 
 
@@ -1039,22 +1554,22 @@ with tab7:
 
         # Attach commit type per commit
         if "commit_type" not in bubble_commits.columns:
-            bubble_commits["commit_type"] = bubble_commits["message"].apply(commit_type)
+            bubble_commits["commit_type"] = commit_types(bubble_commits["message"])
 
         # Dominant commit type = the type with the most commits for that author
         dominant_type = (
-            bubble_commits.groupby(["author_name", "commit_type"])
+            bubble_commits.groupby(["author_name", "commit_type"], observed=True)
             .size()
             .reset_index(name="n")
             .sort_values("n", ascending=False)
-            .groupby("author_name")
+            .groupby("author_name", observed=True)
             .first()
             .reset_index()[["author_name", "commit_type"]]
             .rename(columns={"commit_type": "dominant_type"})
         )
 
         author_bubbles = (
-            bubble_commits.groupby("author_name")
+            bubble_commits.groupby("author_name", observed=True)
             .agg(
                 first_commit=("committed_at", "min"),
                 last_commit=("committed_at", "max"),
@@ -1079,8 +1594,8 @@ with tab7:
 
         # Tooltip text
         author_bubbles["hover"] = (
-            "<b>" + author_bubbles["author_name"] + "</b><br>"
-            + "Dominant type: " + author_bubbles["dominant_type"].fillna("other") + "<br>"
+            "<b>" + author_bubbles["author_name"].astype(str) + "</b><br>"
+            + "Dominant type: " + author_bubbles["dominant_type"].astype(object).fillna("other") + "<br>"
             + "First commit: " + author_bubbles["first_commit"].dt.strftime("%Y-%m-%d") + "<br>"
             + "Last commit: "  + author_bubbles["last_commit"].dt.strftime("%Y-%m-%d")  + "<br>"
             + "Commits: "      + author_bubbles["commit_count"].astype(str) + "<br>"
@@ -1154,7 +1669,7 @@ with tab7:
             template="plotly_white",
             hovermode="closest",
         )
-        st.plotly_chart(fig_bubbles, use_container_width=True)
+        st.plotly_chart(fig_bubbles, use_container_width=True, key="bubbles_chart")
 
         # ── Colour legend ─────────────────────────────────────────────
         present_types = df_plot["dominant_type"].dropna().unique()
@@ -1180,12 +1695,8 @@ with tab7:
                        "Commits", "Lines added", "Lines removed", "Net LOC"]
         tbl = tbl.sort_values("Lines added", ascending=False).reset_index(drop=True)
 
-        def _style_dominant(val: str) -> str:
-            c = COMMIT_TYPE_COLORS.get(val, "")
-            return f"color: {c}; font-weight: bold" if c else ""
-
         st.dataframe(
-            tbl.style.applymap(_style_dominant, subset=["Type"]),
+            tbl.style.apply(_bold_color_css, colors=COMMIT_TYPE_COLORS, subset=["Type"]),
             use_container_width=True,
             hide_index=True,
         )
@@ -14,6 +14,7 @@ def __getattr__(name: str):  # noqa: N807
         "get_folder_changes": ("folders", "get_folder_changes"),
         "get_diff_stats": ("diff_stats", "get_diff_stats"),
         "get_loc_over_time": ("loc", "get_loc_over_time"),
+        "run_all": ("combined", "run_all"),
     }
     if name in _map:
         mod_name, attr = _map[name]
@@ -28,4 +29,5 @@ __all__ = [
     "get_folder_changes",
     "get_diff_stats",
     "get_loc_over_time",
+    "run_all",
 ]
@@ -4,21 +4,74 @@ from __future__ import annotations
 
 import sys
 from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from git import Repo
 
+from archeologit.cache import disk_cache
 from archeologit.models import AuthorStats, BranchAuthors, to_json
-from archeologit.repo import default_branch, list_branches, open_repo
+from archeologit.repo import CommitNumstat, default_branch, iter_numstat, list_branches, open_repo
 
+# Concurrent branch walks (each one a `git log` process)
+_MAX_WORKERS = 8
 
+
+def _branch_authors(
+    repo: Repo,
+    branch_name: str,
+    max_count: int | None,
+    since: str | None,
+    until: str | None,
+) -> BranchAuthors:
+    """Author stats for a single branch (see :func:`get_branch_authors`)."""
+    # One `git log --numstat` per branch instead of a `git diff` per commit;
+    # branches already run in parallel, so don't split each walk further
+    commits = iter_numstat(repo, branch_name, max_count, since, until, workers=1)
+    return _authors_from_numstat(branch_name, commits)
+
+
+def _authors_from_numstat(branch_name: str, commits: Iterable[CommitNumstat]) -> BranchAuthors:
+    # author_email → running totals
+    stats: dict[str, dict] = defaultdict(
+        lambda: {"name": "", "commits": 0, "added": 0, "removed": 0}
+    )
+
+    for commit in commits:
+        key = commit.author_email or commit.author_name or "unknown"
+        entry = stats[key]
+        entry["name"] = commit.author_name or key
+        entry["commits"] += 1
+        entry["added"] += commit.insertions
+        entry["removed"] += commit.deletions
+
+    authors = [
+        AuthorStats(
+            author_name=v["name"],
+            author_email=email,
+            commit_count=v["commits"],
+            lines_added=v["added"],
+            lines_removed=v["removed"],
+        )
+        for email, v in sorted(stats.items(), key=lambda x: -x[1]["commits"])
+    ]
+    return BranchAuthors(branch_name=branch_name, authors=authors)
+
+
+@disk_cache
 def get_branch_authors(
     repo: Repo,
     branches: list[str] | None = None,
     max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
 ) -> list[BranchAuthors]:
     """Return per-branch author stats (commits + lines added/removed).
 
+    Branches are walked concurrently; each walk is a ``git`` subprocess, so
+    threads overlap them without contending for the GIL.
+
     Parameters
     ----------
     repo:
@@ -27,40 +80,22 @@ def get_branch_authors(
         Explicit list of branch names to analyse. Defaults to all local branches.
     max_count:
         Cap commits walked per branch (most-recent first).
+    since:
+        Only walk commits newer than this git date (e.g. ``2024-01-31``).
+    until:
+        Only walk commits older than this git date.
     """
     target_branches = branches or list_branches(repo)
-    kwargs: dict = {}
-    if max_count is not None:
-        kwargs["max_count"] = max_count
-
-    results: list[BranchAuthors] = []
-    for branch_name in target_branches:
-        # author_email → running totals
-        stats: dict[str, dict] = defaultdict(
-            lambda: {"name": "", "commits": 0, "added": 0, "removed": 0}
-        )
+    if len(target_branches) <= 1:
+        return [_branch_authors(repo, b, max_count, since, until) for b in target_branches]
+
+    # A Repo per worker: GitPython objects are not meant to be shared across threads
+    def walk(branch_name: str) -> BranchAuthors:
+        with Repo(repo.git_dir) as worker_repo:
+            return _branch_authors(worker_repo, branch_name, max_count, since, until)
 
-        for commit in repo.iter_commits(branch_name, **kwargs):
-            key = commit.author.email or commit.author.name or "unknown"
-            entry = stats[key]
-            entry["name"] = commit.author.name or key
-            entry["commits"] += 1
-            entry["added"] += commit.stats.total["insertions"]
-            entry["removed"] += commit.stats.total["deletions"]
-
-        authors = [
-            AuthorStats(
-                author_name=v["name"],
-                author_email=email,
-                commit_count=v["commits"],
-                lines_added=v["added"],
-                lines_removed=v["removed"],
-            )
-            for email, v in sorted(stats.items(), key=lambda x: -x[1]["commits"])
-        ]
-        results.append(BranchAuthors(branch_name=branch_name, authors=authors))
-
-    return results
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(target_branches))) as pool:
+        return list(pool.map(walk, target_branches))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,118 @@
+"""Run every analyzer over one shared walk of the history (``main.py all``)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from git import Repo
+
+from archeologit.analyzers.authors import _authors_from_numstat, get_branch_authors
+from archeologit.analyzers.commit_log import _commit_info
+from archeologit.analyzers.diff_stats import _diff_stats
+from archeologit.analyzers.folders import get_folder_changes
+from archeologit.analyzers.loc import _loc_snapshots
+from archeologit.analyzers.merges import _merge_event
+from archeologit.cache import disk_cache
+from archeologit.models import BranchAuthors, CommitInfo, DiffStats, FolderChange, LOCSnapshot, MergeEvent
+from archeologit.repo import (
+    CommitNumstat,
+    build_sha_to_branch_index,
+    default_branch,
+    iter_commits_with_numstat,
+    list_branches,
+    open_repo,
+)
+
+
+class AnalyzerResults(NamedTuple):
+    """What each ``get_*`` analyzer would return for the same arguments."""
+
+    commit_log: list[CommitInfo]
+    merges: list[MergeEvent]
+    authors: list[BranchAuthors]
+    folder_changes: list[FolderChange]
+    diff_stats: list[DiffStats]
+    loc_over_time: list[LOCSnapshot]
+
+
+@disk_cache
+def run_all(
+    repo: Repo,
+    branch: str | None = None,
+    branches: list[str] | None = None,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    depth: int = 2,
+) -> AnalyzerResults:
+    """Run all six analyzers on *branch*, walking its history as few times as possible.
+
+    Commit log, merges, diff stats, LOC and the *branch* entry of the author
+    stats are all built from a single ``git log --numstat`` (see
+    :func:`~archeologit.repo.iter_commits_with_numstat`).  Folder changes need
+    rename detection, which would change the line counts, so they keep their
+    own ``git log --raw`` walk; authors on other branches walk those branches.
+
+    Parameters
+    ----------
+    repo:
+        Open GitPython Repo object.
+    branch:
+        Branch to walk (default: repo's default branch).
+    branches:
+        Branches for the author stats, as in :func:`get_branch_authors`
+        (default: all local branches).
+    max_count:
+        Cap the number of commits walked per branch.
+    since:
+        Only walk commits newer than this git date (e.g. ``2024-01-31``).
+    until:
+        Only walk commits older than this git date.
+    depth:
+        Directory depth for the folder changes.
+    """
+    target = branch or default_branch(repo)
+    sha_to_branch = build_sha_to_branch_index(repo)
+
+    commit_log: list[CommitInfo] = []
+    merges: list[MergeEvent] = []
+    numstats: list[CommitNumstat] = []
+    for rec, numstat in iter_commits_with_numstat(repo, target, max_count, since, until):
+        commit_log.append(_commit_info(rec, numstat.paths))
+        event = _merge_event(rec, sha_to_branch, include_squash=True)
+        if event is not None:
+            merges.append(event)
+        numstats.append(numstat)
+
+    author_branches = branches or list_branches(repo)
+    others = [b for b in author_branches if b != target]
+    by_branch: dict[str, BranchAuthors] = {}
+    if others:
+        walked = get_branch_authors(repo, branches=others, max_count=max_count, since=since, until=until)
+        by_branch = {a.branch_name: a for a in walked}
+    if target in author_branches:
+        by_branch[target] = _authors_from_numstat(target, numstats)
+
+    return AnalyzerResults(
+        commit_log=commit_log,
+        merges=merges,
+        authors=[by_branch[b] for b in author_branches],
+        folder_changes=get_folder_changes(
+            repo, branch=target, max_count=max_count, since=since, until=until, depth=depth
+        ),
+        diff_stats=[_diff_stats(c) for c in numstats],
+        loc_over_time=_loc_snapshots(numstats, sample_every=1),
+    )
+
+
+if __name__ == "__main__":
+    repo_path = sys.argv[1] if len(sys.argv) > 1 else "/Users/vaskendermardiros/Repos/aily-super-agent"
+    branch_arg = sys.argv[2] if len(sys.argv) > 2 else None
+    max_arg = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    r = open_repo(Path(repo_path))
+    results = run_all(r, branch=branch_arg, max_count=max_arg)
+    for name, value in results._asdict().items():
+        print(f"  {name:<15}: {len(value)}")
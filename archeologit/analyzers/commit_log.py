@@ -7,14 +7,18 @@ from pathlib import Path
 
 from git import Repo
 
+from archeologit.cache import disk_cache
 from archeologit.models import CommitInfo, to_json
-from archeologit.repo import default_branch, open_repo
+from archeologit.repo import CommitRecord, default_branch, iter_commit_records, iter_numstat, open_repo
 
 
+@disk_cache
 def get_commit_log(
     repo: Repo,
     branch: str | None = None,
     max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
     include_paths: bool = True,
 ) -> list[CommitInfo]:
     """Return a list of :class:`CommitInfo` for *branch* (default: default branch).
@@ -27,35 +31,41 @@ def get_commit_log(
         Branch name to walk. Falls back to the repo's default branch.
     max_count:
         Cap the number of commits returned (most-recent first).
+    since:
+        Only walk commits newer than this git date (e.g. ``2024-01-31``).
+    until:
+        Only walk commits older than this git date.
     include_paths:
         When True, populate ``changed_paths`` with the list of file paths
-        touched by each commit. Slightly slower due to stat computation.
+        touched by each commit. Costs one extra ``git log --numstat`` pass.
     """
     target = branch or default_branch(repo)
-    kwargs: dict = {}
-    if max_count is not None:
-        kwargs["max_count"] = max_count
+
+    # Paths come from a second `git log --numstat` over the same commits, in
+    # the same order, instead of one `commit.stats` diff per commit
+    numstats = iter_numstat(repo, target, max_count, since, until) if include_paths else None
 
     results: list[CommitInfo] = []
-    for commit in repo.iter_commits(target, **kwargs):
+    for rec in iter_commit_records(repo, target, max_count, since, until):
         paths: list[str] = []
-        if include_paths:
-            paths = list(commit.stats.files.keys())
-
-        results.append(
-            CommitInfo(
-                sha=commit.hexsha,
-                short_sha=commit.hexsha[:8],
-                author_name=commit.author.name or "",
-                author_email=commit.author.email or "",
-                committed_at=commit.committed_datetime,
-                message=commit.message.strip(),
-                changed_paths=paths,
-            )
-        )
+        if numstats is not None:
+            paths = next(numstats).paths
+        results.append(_commit_info(rec, paths))
     return results
 
 
+def _commit_info(rec: CommitRecord, paths: list[str]) -> CommitInfo:
+    return CommitInfo(
+        sha=rec.sha,
+        short_sha=rec.sha[:8],
+        author_name=rec.author_name,
+        author_email=rec.author_email,
+        committed_at=rec.committed_at,
+        message=rec.message.strip(),
+        changed_paths=paths,
+    )
+
+
 if __name__ == "__main__":
     repo_path = sys.argv[1] if len(sys.argv) > 1 else "/Users/vaskendermardiros/Repos/aily-super-agent"
     branch_arg = sys.argv[2] if len(sys.argv) > 2 else None
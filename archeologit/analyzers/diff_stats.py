@@ -8,18 +8,23 @@ from pathlib import Path
 
 from git import Repo
 
+from archeologit.cache import disk_cache
 from archeologit.models import DiffStats, to_json
-from archeologit.repo import default_branch, open_repo
+from archeologit.repo import CommitNumstat, default_branch, iter_numstat, open_repo
 
 
+@disk_cache
 def get_diff_stats(
     repo: Repo,
     branch: str | None = None,
     max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
 ) -> list[DiffStats]:
     """Return per-commit diff statistics for *branch*.
 
-    Uses ``commit.stats.total`` which GitPython derives from ``git diff --stat``.
+    Reads every commit's stats from one ``git log --numstat`` (see
+    :func:`~archeologit.repo.iter_numstat`), matching ``commit.stats.total``.
     The result includes raw per-commit numbers and a synthetic ``totals`` entry
     appended at the end of the list for quick aggregation (sha="TOTAL").
 
@@ -31,38 +36,23 @@ def get_diff_stats(
         Branch to walk (default: repo's default branch).
     max_count:
         Cap the number of commits.
+    since:
+        Only walk commits newer than this git date (e.g. ``2024-01-31``).
+    until:
+        Only walk commits older than this git date.
     """
     target = branch or default_branch(repo)
-    kwargs: dict = {}
-    if max_count is not None:
-        kwargs["max_count"] = max_count
+    return [_diff_stats(c) for c in iter_numstat(repo, target, max_count, since, until)]
 
-    results: list[DiffStats] = []
-    total_insertions = 0
-    total_deletions = 0
-    total_files = 0
 
-    for commit in repo.iter_commits(target, **kwargs):
-        totals = commit.stats.total
-        ins = totals.get("insertions", 0)
-        dels = totals.get("deletions", 0)
-        files = totals.get("files", 0)
-
-        total_insertions += ins
-        total_deletions += dels
-        total_files += files
-
-        results.append(
-            DiffStats(
-                sha=commit.hexsha[:8],
-                committed_at=commit.committed_datetime,
-                insertions=ins,
-                deletions=dels,
-                files_changed=files,
-            )
-        )
-
-    return results
+def _diff_stats(c: CommitNumstat) -> DiffStats:
+    return DiffStats(
+        sha=c.sha[:8],
+        committed_at=c.committed_at,
+        insertions=c.insertions,
+        deletions=c.deletions,
+        files_changed=c.files,
+    )
 
 
 def aggregate(stats: list[DiffStats]) -> dict:
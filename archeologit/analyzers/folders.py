@@ -2,34 +2,50 @@
 
 from __future__ import annotations
 
+import functools
 import sys
-from pathlib import Path, PurePosixPath
+from collections.abc import Iterator
+from pathlib import Path
 
 from git import Repo
 
+from archeologit.cache import disk_cache
 from archeologit.models import FolderChange, to_json
-from archeologit.repo import default_branch, open_repo
+from archeologit.repo import default_branch, iter_raw_changes, open_repo
 
 
-def _extract_directories(path_str: str, depth: int = 2) -> list[str]:
-    """Return the ancestor directory names up to *depth* levels for a file path."""
-    parts = PurePosixPath(path_str).parts
-    dirs: list[str] = []
+@functools.lru_cache(maxsize=100_000)
+def _extract_directories(path_str: str, depth: int = 2) -> tuple[str, ...]:
+    """Return the ancestor directory names up to *depth* levels for a file path.
+
+    Git paths are already normalised ``/``-separated strings, so plain string
+    joins replace ``PurePosixPath``; cached because the same files are touched
+    by many commits.
+    """
+    parts = path_str.split("/")
     # parts[-1] is the filename itself; everything before is a directory level
-    for i in range(1, min(len(parts), depth + 1)):
-        dirs.append(str(PurePosixPath(*parts[:i])))
-    return dirs
+    dirs: list[str] = []
+    acc = ""
+    for part in parts[:min(len(parts) - 1, depth)]:
+        acc = f"{acc}/{part}" if acc else part
+        dirs.append(acc)
+    return tuple(dirs)
 
 
+@disk_cache
 def get_folder_changes(
     repo: Repo,
     branch: str | None = None,
     depth: int = 2,
     max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
 ) -> list[FolderChange]:
     """Return directory-level change events extracted from commit diffs.
 
-    For each commit, diff against its first parent to find which paths changed.
+    For each commit, diff against its first parent to find which paths changed
+    (one ``git log --raw`` for the whole walk, see
+    :func:`~archeologit.repo.iter_raw_changes`).
     Each changed file path is decomposed into its ancestor directories (up to
     *depth* levels), and a :class:`FolderChange` is emitted for every unique
     (commit, directory, change_type) combination.
@@ -44,13 +60,26 @@ def get_folder_changes(
         How many directory levels to track (1 = top-level only, 2 = two levels).
     max_count:
         Cap the number of commits to walk.
+    since:
+        Only walk commits newer than this git date (e.g. ``2024-01-31``).
+    until:
+        Only walk commits older than this git date.
     """
+    return list(iter_folder_changes(repo, branch, depth, max_count, since, until))
+
+
+def iter_folder_changes(
+    repo: Repo,
+    branch: str | None = None,
+    depth: int = 2,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> Iterator[FolderChange]:
+    """Like :func:`get_folder_changes`, but yield events as the walk goes (uncached)."""
     target = branch or default_branch(repo)
-    kwargs: dict = {}
-    if max_count is not None:
-        kwargs["max_count"] = max_count
 
-    # Map GitPython diff change_type codes to human-readable labels
+    # Map git diff status letters to human-readable labels
     _change_map = {
         "A": "added",
         "D": "removed",
@@ -60,37 +89,29 @@ def get_folder_changes(
         "T": "type-changed",
     }
 
-    results: list[FolderChange] = []
-    for commit in repo.iter_commits(target, **kwargs):
-        if not commit.parents:
-            # Initial commit: diff vs empty tree
-            diffs = commit.diff(None)
-        else:
-            diffs = commit.parents[0].diff(commit)
-
-        seen: set[tuple[str, str]] = set()
-        for diff in diffs:
-            change_label = _change_map.get(diff.change_type, diff.change_type)
-            # Use a_path for deletions, b_path for additions/modifications
-            path = diff.b_path or diff.a_path or ""
-            if not path:
-                continue
+    # (directory, change_type) pairs already emitted for the current commit, as
+    # dense ints in one reused set rather than a fresh set of tuples per commit
+    dir_ids: dict[str, int] = {}
+    change_ids: dict[str, int] = {label: i for i, label in enumerate(_change_map.values())}
+    seen: set[int] = set()
+
+    for commit in iter_raw_changes(repo, target, max_count, since, until):
+        seen.clear()
+        for status, path in commit.changes:
+            change_label = _change_map.get(status, status)
+            change_id = change_ids.setdefault(change_label, len(change_ids))
             for directory in _extract_directories(path, depth=depth):
-                key = (directory, change_label)
+                key = dir_ids.setdefault(directory, len(dir_ids)) << 4 | change_id
                 if key in seen:
                     continue
                 seen.add(key)
-                results.append(
-                    FolderChange(
-                        sha=commit.hexsha[:8],
-                        committed_at=commit.committed_datetime,
-                        directory=directory,
-                        change_type=change_label,
-                    )
+                yield FolderChange(
+                    sha=commit.sha[:8],
+                    committed_at=commit.committed_at,
+                    directory=directory,
+                    change_type=change_label,
                 )
 
-    return results
-
 
 if __name__ == "__main__":
     repo_path = sys.argv[1] if len(sys.argv) > 1 else "/Users/vaskendermardiros/Repos/aily-super-agent"
@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from git import Repo
 
+from archeologit.cache import disk_cache
 from archeologit.models import LOCSnapshot, to_json
-from archeologit.repo import default_branch, open_repo
+from archeologit.repo import CommitNumstat, default_branch, iter_numstat, open_repo
 
 
+@disk_cache
 def get_loc_over_time(
     repo: Repo,
     branch: str | None = None,
     max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
     sample_every: int = 1,
 ) -> list[LOCSnapshot]:
     """Return cumulative LOC snapshots over the commit history of *branch*.
@@ -23,7 +28,8 @@ def get_loc_over_time(
     ``insertions - deletions`` starting from the first (oldest) commit on the
     branch.  This is a fast approximation; it does not reflect deleted files
     whose lines were previously counted, but it accurately tracks the net
-    line-count trend over time.
+    line-count trend over time.  Per-commit stats come from one
+    ``git log --numstat`` (see :func:`~archeologit.repo.iter_numstat`).
 
     Commits are returned in chronological order (oldest first).
 
@@ -35,36 +41,52 @@ def get_loc_over_time(
         Branch to walk (default: repo's default branch).
     max_count:
         Cap the number of commits to walk (most-recent first before reversal).
+    since:
+        Only walk commits newer than this git date (e.g. ``2024-01-31``).
+    until:
+        Only walk commits older than this git date.
     sample_every:
         Take a snapshot every N commits to reduce output size on large repos.
         1 (default) = every commit.
     """
+    return list(iter_loc_over_time(repo, branch, max_count, since, until, sample_every))
+
+
+def iter_loc_over_time(
+    repo: Repo,
+    branch: str | None = None,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    sample_every: int = 1,
+) -> Iterator[LOCSnapshot]:
+    """Like :func:`get_loc_over_time`, but yield snapshots as the walk goes (uncached)."""
     target = branch or default_branch(repo)
-    kwargs: dict = {}
-    if max_count is not None:
-        kwargs["max_count"] = max_count
+    commits = iter_numstat(repo, target, max_count, since, until, reverse=True)  # oldest first
+    yield from _iter_loc_snapshots(commits, sample_every)
 
-    # Collect in reverse (newest first) then reverse to chronological
-    commits = list(repo.iter_commits(target, **kwargs))
-    commits.reverse()  # oldest → newest
 
-    results: list[LOCSnapshot] = []
-    cumulative = 0
+def _loc_snapshots(commits: list[CommitNumstat], sample_every: int) -> list[LOCSnapshot]:
+    """Running LOC over *commits* (newest first, as git lists them); see :func:`get_loc_over_time`."""
+    return list(_iter_loc_snapshots(reversed(commits), sample_every))
+
 
+def _iter_loc_snapshots(commits: Iterable[CommitNumstat], sample_every: int) -> Iterator[LOCSnapshot]:
+    # commits come oldest → newest; the last one is always kept
+    cumulative = 0
+    last: LOCSnapshot | None = None
     for i, commit in enumerate(commits):
-        totals = commit.stats.total
-        cumulative += totals.get("insertions", 0) - totals.get("deletions", 0)
-
-        if i % sample_every == 0 or i == len(commits) - 1:
-            results.append(
-                LOCSnapshot(
-                    sha=commit.hexsha[:8],
-                    committed_at=commit.committed_datetime,
-                    cumulative_loc=cumulative,
-                )
-            )
-
-    return results
+        cumulative += commit.insertions - commit.deletions
+        last = LOCSnapshot(
+            sha=commit.sha[:8],
+            committed_at=commit.committed_at,
+            cumulative_loc=cumulative,
+        )
+        if i % sample_every == 0:
+            yield last
+            last = None
+    if last is not None:
+        yield last
 
 
 if __name__ == "__main__":
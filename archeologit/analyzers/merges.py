@@ -3,7 +3,7 @@
 Two merge styles are supported:
 
 - **classic**: a commit with 2+ parents (traditional ``git merge``).
-- **squash**: a single-parent commit whose message contains a GitHub/GitLab
+- **squash**: a single-parent commit whose subject line contains a GitHub/GitLab
   PR reference like ``(#1055)`` or ``!42``.  This is the common pattern when
   teams use "Squash and merge" or "Rebase and merge" on GitHub/GitLab.
 """
@@ -16,24 +16,40 @@ from pathlib import Path
 
 from git import Repo
 
+from archeologit.cache import disk_cache
 from archeologit.models import MergeEvent, to_json
-from archeologit.repo import default_branch, open_repo, resolve_ref_to_branch
+from archeologit.repo import (
+    CommitRecord,
+    build_sha_to_branch_index,
+    default_branch,
+    iter_commit_records,
+    open_repo,
+)
 
-# Matches GitHub "(#123)" or GitLab "!123" PR/MR references in commit messages
-_PR_RE = re.compile(r"\(#(\d+)\)|(?:^|\s)!(\d+)(?:\s|$)")
+# GitHub "(#123)" and GitLab "!123" PR/MR references in commit messages; one
+# capture group each and possessive digits, so a miss never backtracks
+_PR_GH_RE = re.compile(r"\(#(\d++)\)")
+_PR_GL_RE = re.compile(r"(?:\A|\s)!(\d++)(?:\s|\Z)")
 
 
 def _extract_pr_number(message: str) -> int | None:
-    m = _PR_RE.search(message)
+    # Only the subject line carries the PR reference; long bodies (release
+    # notes, generated changelogs) are never scanned
+    subject = message.lstrip().partition("\n")[0]
+    # GitHub references are by far the commoner, so try them first
+    m = _PR_GH_RE.search(subject) or _PR_GL_RE.search(subject)
     if not m:
         return None
-    return int(m.group(1) or m.group(2))
+    return int(m.group(1))
 
 
+@disk_cache
 def get_merges_to_main(
     repo: Repo,
     branch: str | None = None,
     max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
     include_squash: bool = True,
 ) -> list[MergeEvent]:
     """Return merge events on *branch* (the integration branch, e.g. main/master).
@@ -42,8 +58,8 @@ def get_merges_to_main(
 
     - **classic** — commits with two or more parents (``git merge``).
       The second parent is resolved to a branch name where possible.
-    - **squash/rebase** — single-parent commits on *branch* whose message
-      contains a PR/MR reference such as ``(#1055)``.  Enabled when
+    - **squash/rebase** — single-parent commits on *branch* whose subject
+      line contains a PR/MR reference such as ``(#1055)``.  Enabled when
       *include_squash* is True (default).
 
     Parameters
@@ -54,59 +70,56 @@ def get_merges_to_main(
         The integration branch to inspect (default: repo's default branch).
     max_count:
         Cap the total commits to walk.
+    since:
+        Only walk commits newer than this git date (e.g. ``2024-01-31``).
+    until:
+        Only walk commits older than this git date.
     include_squash:
         Also detect squash/rebase PRs via PR number in commit message.
     """
     target = branch or default_branch(repo)
-    kwargs: dict = {}
-    if max_count is not None:
-        kwargs["max_count"] = max_count
 
     # sha → branch-name lookup for classic merge resolution
-    sha_to_branch: dict[str, str] = {}
-    for ref in repo.references:
-        sha_to_branch[ref.commit.hexsha] = ref.name.split("/")[-1]
+    sha_to_branch = build_sha_to_branch_index(repo)
 
     results: list[MergeEvent] = []
-    for commit in repo.iter_commits(target, **kwargs):
-        message = commit.message.strip()
-
-        if len(commit.parents) >= 2:
-            # Classic merge commit
-            merged_tip = commit.parents[1]
-            merged_branch = (
-                sha_to_branch.get(merged_tip.hexsha)
-                or resolve_ref_to_branch(repo, merged_tip.hexsha)
-                or merged_tip.hexsha[:8]
-            )
-            results.append(
-                MergeEvent(
-                    merge_commit_sha=commit.hexsha[:8],
-                    merged_at=commit.committed_datetime,
-                    message=message,
-                    merged_branch=merged_branch,
-                    pr_number=_extract_pr_number(message),
-                    merge_style="classic",
-                )
-            )
-
-        elif include_squash:
-            pr_number = _extract_pr_number(message)
-            if pr_number is not None:
-                results.append(
-                    MergeEvent(
-                        merge_commit_sha=commit.hexsha[:8],
-                        merged_at=commit.committed_datetime,
-                        message=message,
-                        merged_branch=f"PR #{pr_number}",
-                        pr_number=pr_number,
-                        merge_style="squash",
-                    )
-                )
+    for commit in iter_commit_records(repo, target, max_count, since, until):
+        event = _merge_event(commit, sha_to_branch, include_squash)
+        if event is not None:
+            results.append(event)
 
     return results
 
 
+def _merge_event(commit: CommitRecord, sha_to_branch: dict[str, str], include_squash: bool) -> MergeEvent | None:
+    """The merge event *commit* represents, if any (see :func:`get_merges_to_main`)."""
+    if len(commit.parents) >= 2:
+        # Classic merge commit
+        merged_tip = commit.parents[1]
+        merged_branch = sha_to_branch.get(merged_tip) or merged_tip[:8]
+        message = commit.message.strip()
+        return MergeEvent(
+            merge_commit_sha=commit.sha[:8],
+            merged_at=commit.committed_at,
+            message=message,
+            merged_branch=merged_branch,
+            pr_number=_extract_pr_number(message),
+            merge_style="classic",
+        )
+
+    if include_squash:
+        pr_number = _extract_pr_number(commit.message)
+        if pr_number is not None:
+            return MergeEvent(
+                merge_commit_sha=commit.sha[:8],
+                merged_at=commit.committed_at,
+                message=commit.message.strip(),
+                merged_branch=f"PR #{pr_number}",
+                pr_number=pr_number,
+                merge_style="squash",
+            )
+    return None
+
 if __name__ == "__main__":
     repo_path = sys.argv[1] if len(sys.argv) > 1 else "/Users/vaskendermardiros/Repos/aily-super-agent"
     branch_arg = sys.argv[2] if len(sys.argv) > 2 else None
@@ -0,0 +1,89 @@
+"""On-disk memoisation of analyzer results.
+
+Results are pickled under ``<git dir>/archeologit-cache/<state>/`` where
+*state* fingerprints the repository's refs and this package's source, so a
+new commit, branch or tag (or an archeologit upgrade) starts a fresh
+directory; older ones are removed as soon as a new one is written.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import pickle
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from git import GitCommandError, Repo
+
+from archeologit.repo import get_backend
+
+R = TypeVar("R")
+
+_CACHE_DIRNAME = "archeologit-cache"
+_enabled = True
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn the cache on or off for this process (``main.py --no-cache``)."""
+    global _enabled
+    _enabled = enabled
+
+
+@functools.cache
+def _source_fingerprint() -> str:
+    h = hashlib.sha1()
+    for path in sorted(Path(__file__).parent.rglob("*.py")):
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _refs_fingerprint(repo: Repo) -> str | None:
+    """Every ref and its tip (``git show-ref --head``); ``None`` for a repo without refs."""
+    try:
+        return repo.git.show_ref("--head")
+    except GitCommandError:
+        return None
+
+
+def disk_cache(func: Callable[..., R]) -> Callable[..., R]:
+    """Memoise an analyzer ``func(repo, ...)`` on disk.
+
+    Reading or writing the cache is best-effort: an unreadable entry or a
+    read-only git directory just means the analyzer runs.
+    """
+
+    @functools.wraps(func)
+    def wrapper(repo: Repo, *args: Any, **kwargs: Any) -> R:
+        refs = _refs_fingerprint(repo) if _enabled else None
+        if refs is None:
+            return func(repo, *args, **kwargs)
+
+        root = Path(repo.git_dir) / _CACHE_DIRNAME
+        state = hashlib.sha256((_source_fingerprint() + refs).encode()).hexdigest()
+        call = (func.__qualname__, args, sorted(kwargs.items()), get_backend())
+        key = hashlib.sha256(repr(call).encode()).hexdigest()
+        path = root / state / f"{func.__name__}-{key}.pkl"
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+
+        result = func(repo, *args, **kwargs)
+        tmp = path.with_suffix(".tmp")
+        try:
+            if not path.parent.is_dir():
+                for stale in root.glob("*"):
+                    shutil.rmtree(stale, ignore_errors=True)
+                path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+        return result
+
+    return wrapper
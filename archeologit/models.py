@@ -3,28 +3,59 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any
+from typing import IO, Any
 
+try:
+    import orjson  # optional: `uv sync --extra fast`
+except ImportError:
+    orjson = None
 
-def _default_serializer(obj: Any) -> Any:
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+class ReportEncoder(json.JSONEncoder):
+    """JSON encoder for analyzer results: datetimes as ISO strings, dataclasses as objects.
+
+    Records are expanded one level at a time through their ``to_dict`` (nested
+    ones come back through :meth:`default`), so nothing is deep-copied the way
+    ``asdict`` does.
+    """
+
+    def default(self, obj: Any) -> Any:
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if hasattr(obj, "to_dict"):
+            return obj.to_dict()
+        if hasattr(obj, "__dataclass_fields__"):
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+        return super().default(obj)
+
+
+def to_json_stream(data: Any, fp: IO[str], indent: int = 2) -> None:
+    """Write *data* (dataclasses, lists of them, plain JSON values) to *fp* as JSON."""
+    json.dump(data, fp, indent=indent, cls=ReportEncoder)
+
+
+def to_jsonl(items: Iterable[Any], fp: IO[str]) -> None:
+    """Write one compact JSON object per line, consuming *items* lazily."""
+    for item in items:
+        if orjson is not None:
+            fp.write(orjson.dumps(item).decode())
+        else:
+            fp.write(json.dumps(item, cls=ReportEncoder, separators=(",", ":")))
+        fp.write("\n")
 
 
 def to_json(data: Any, indent: int = 2) -> str:
-    if isinstance(data, list):
-        serializable = [asdict(item) if hasattr(item, "__dataclass_fields__") else item for item in data]
-    elif hasattr(data, "__dataclass_fields__"):
-        serializable = asdict(data)
-    else:
-        serializable = data
-    return json.dumps(serializable, indent=indent, default=_default_serializer)
+    # orjson encodes dataclasses and datetimes natively, but only indents by 2
+    if orjson is not None and indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=indent, cls=ReportEncoder)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitInfo:
     sha: str
     short_sha: str
@@ -34,8 +65,24 @@ class CommitInfo:
     message: str
     changed_paths: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # The same few authors recur across thousands of records; share one str each
+        self.author_name = sys.intern(self.author_name)
+        self.author_email = sys.intern(self.author_email)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sha": self.sha,
+            "short_sha": self.short_sha,
+            "author_name": self.author_name,
+            "author_email": self.author_email,
+            "committed_at": self.committed_at,
+            "message": self.message,
+            "changed_paths": self.changed_paths,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class MergeEvent:
     merge_commit_sha: str
     merged_at: datetime
@@ -44,8 +91,18 @@ class MergeEvent:
     pr_number: int | None  # set for squash/rebase PRs detected via "(#NNN)" in message
     merge_style: str  # "classic" (2-parent merge commit) | "squash" (single commit with PR ref)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "merge_commit_sha": self.merge_commit_sha,
+            "merged_at": self.merged_at,
+            "message": self.message,
+            "merged_branch": self.merged_branch,
+            "pr_number": self.pr_number,
+            "merge_style": self.merge_style,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class AuthorStats:
     author_name: str
     author_email: str
@@ -53,22 +110,53 @@ class AuthorStats:
     lines_added: int
     lines_removed: int
 
+    def __post_init__(self) -> None:
+        self.author_name = sys.intern(self.author_name)
+        self.author_email = sys.intern(self.author_email)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "author_name": self.author_name,
+            "author_email": self.author_email,
+            "commit_count": self.commit_count,
+            "lines_added": self.lines_added,
+            "lines_removed": self.lines_removed,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class BranchAuthors:
     branch_name: str
     authors: list[AuthorStats] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "branch_name": self.branch_name,
+            "authors": self.authors,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class FolderChange:
     sha: str
     committed_at: datetime
     directory: str
     change_type: str  # "added", "removed", "modified", "renamed"
 
+    def __post_init__(self) -> None:
+        self.directory = sys.intern(self.directory)
+        self.change_type = sys.intern(self.change_type)
 
-@dataclass
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sha": self.sha,
+            "committed_at": self.committed_at,
+            "directory": self.directory,
+            "change_type": self.change_type,
+        }
+
+
+@dataclass(slots=True)
 class DiffStats:
     sha: str
     committed_at: datetime
@@ -76,9 +164,25 @@ class DiffStats:
     deletions: int
     files_changed: int
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sha": self.sha,
+            "committed_at": self.committed_at,
+            "insertions": self.insertions,
+            "deletions": self.deletions,
+            "files_changed": self.files_changed,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class LOCSnapshot:
     sha: str
     committed_at: datetime
     cumulative_loc: int  # running insertions - deletions from repo start
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sha": self.sha,
+            "committed_at": self.committed_at,
+            "cumulative_loc": self.cumulative_loc,
+        }
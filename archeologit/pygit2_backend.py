@@ -0,0 +1,159 @@
+"""libgit2 (pygit2) implementations of the history walks in :mod:`archeologit.repo`.
+
+Selected with ``repo.set_backend("pygit2")`` (``main.py --backend pygit2``).
+Every function here mirrors the ``repo`` helper of the same name and yields
+the same tuples, but walks and diffs in-process instead of parsing ``git log``.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+import pygit2
+from git import Repo
+
+from archeologit.repo import CommitChanges, CommitNumstat, CommitRecord, resolve_date
+
+
+@functools.cache
+def _init() -> None:
+    # Objects come straight from the repository being analysed; re-hashing
+    # every one on read buys nothing here
+    pygit2.option(pygit2.GIT_OPT_ENABLE_STRICT_HASH_VERIFICATION, 0)
+
+
+def _open(repo: Repo) -> pygit2.Repository:
+    _init()
+    return pygit2.Repository(repo.git_dir)
+
+
+def _timestamp(repo: Repo, expr: str) -> int:
+    pinned = expr if expr.startswith("@") else resolve_date(repo, expr)
+    return int(pinned[1:])
+
+
+def _walk(
+    repo: Repo,
+    pg: pygit2.Repository,
+    rev: str,
+    max_count: int | None,
+    since: str | None,
+    until: str | None,
+) -> Iterator[pygit2.Commit]:
+    """Commits of *rev*, newest first, with ``git log``'s --max-count/--since/--until."""
+    since_ts = _timestamp(repo, since) if since is not None else None
+    until_ts = _timestamp(repo, until) if until is not None else None
+    tip = pg.revparse_single(rev).peel(pygit2.Commit)
+    n = 0
+    for commit in pg.walk(tip.id, pygit2.GIT_SORT_TIME):
+        if max_count is not None and n >= max_count:
+            return
+        if since_ts is not None and commit.commit_time < since_ts:
+            return
+        if until_ts is not None and commit.commit_time > until_ts:
+            continue
+        n += 1
+        yield commit
+
+
+def _committed_at(commit: pygit2.Commit) -> datetime:
+    tz = timezone(timedelta(minutes=commit.commit_time_offset))
+    return datetime.fromtimestamp(commit.commit_time, tz)
+
+
+def _record(commit: pygit2.Commit) -> CommitRecord:
+    return CommitRecord(
+        sha=str(commit.id),
+        parents=[str(p) for p in commit.parent_ids],
+        author_name=commit.author.name,
+        author_email=commit.author.email,
+        committed_at=_committed_at(commit),
+        message=commit.message,
+    )
+
+
+def _first_parent_diff(pg: pygit2.Repository, commit: pygit2.Commit) -> pygit2.Diff:
+    if commit.parents:
+        return pg.diff(commit.parents[0], commit)
+    return commit.tree.diff_to_tree(swap=True)  # root commit: everything added
+
+
+def _numstat(pg: pygit2.Repository, commit: pygit2.Commit) -> CommitNumstat:
+    diff = _first_parent_diff(pg, commit)
+    stats = diff.stats
+    return CommitNumstat(
+        sha=str(commit.id),
+        author_name=commit.author.name,
+        author_email=commit.author.email,
+        committed_at=_committed_at(commit),
+        insertions=stats.insertions,
+        deletions=stats.deletions,
+        files=stats.files_changed,
+        paths=[delta.new_file.path for delta in diff.deltas],
+    )
+
+
+def iter_numstat(
+    repo: Repo,
+    rev: str,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    reverse: bool = False,
+) -> Iterator[CommitNumstat]:
+    pg = _open(repo)
+    commits = _walk(repo, pg, rev, max_count, since, until)
+    if reverse:
+        commits = reversed(list(commits))
+    for commit in commits:
+        yield _numstat(pg, commit)
+
+
+def iter_commit_records(
+    repo: Repo,
+    rev: str,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> Iterator[CommitRecord]:
+    pg = _open(repo)
+    for commit in _walk(repo, pg, rev, max_count, since, until):
+        yield _record(commit)
+
+
+def batch_commit_records(repo: Repo, shas: list[str]) -> Iterator[CommitRecord]:
+    pg = _open(repo)
+    for sha in shas:
+        yield _record(pg[sha].peel(pygit2.Commit))
+
+
+def iter_commits_with_numstat(
+    repo: Repo,
+    rev: str,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> Iterator[tuple[CommitRecord, CommitNumstat]]:
+    pg = _open(repo)
+    for commit in _walk(repo, pg, rev, max_count, since, until):
+        yield _record(commit), _numstat(pg, commit)
+
+
+def iter_raw_changes(
+    repo: Repo,
+    rev: str,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> Iterator[CommitChanges]:
+    pg = _open(repo)
+    for commit in _walk(repo, pg, rev, max_count, since, until):
+        diff = _first_parent_diff(pg, commit)
+        diff.find_similar()  # renames, like `git log -M`
+        yield CommitChanges(
+            sha=str(commit.id),
+            committed_at=_committed_at(commit),
+            changes=[(delta.status_char(), delta.new_file.path) for delta in diff.deltas],
+        )
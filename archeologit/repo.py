@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import time
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import IO, NamedTuple
 
-from git import InvalidGitRepositoryError, Repo
+from git import GitCommandError, InvalidGitRepositoryError, Repo
 
 
 def open_repo(path: str | Path = ".") -> Repo:
@@ -16,31 +23,425 @@ def open_repo(path: str | Path = ".") -> Repo:
     return repo
 
 
+def _read_refs(repo: Repo) -> dict[str, str]:
+    """Every ref's full name → the commit it points at, in refname order.
+
+    One ``git for-each-ref`` reads loose and packed refs alike, without the
+    per-ref file lookups and ``Commit`` objects of ``repo.references``;
+    annotated tags are peeled to their commit, like ``ref.commit``.
+    """
+    out = repo.git.for_each_ref("--format=%(objectname)%00%(*objectname)%00%(refname)")
+    refs: dict[str, str] = {}
+    for line in out.splitlines():
+        sha, peeled, name = line.split("\x00")
+        refs[name] = peeled or sha
+    return refs
+
+
 def default_branch(repo: Repo) -> str:
     """Return 'main' or 'master' depending on what exists, else the first branch."""
-    names = {ref.name.split("/")[-1] for ref in repo.references}
+    refs = _read_refs(repo)
+    names = {name.rsplit("/", 1)[-1] for name in refs}
     for candidate in ("main", "master"):
         if candidate in names:
             return candidate
-    branches = list(repo.branches)
+    branches = [name.removeprefix("refs/heads/") for name in refs if name.startswith("refs/heads/")]
     if not branches:
         raise ValueError("Repository has no branches.")
-    return branches[0].name
+    return branches[0]
 
 
 def list_branches(repo: Repo, remote: bool = False) -> list[str]:
     """Return local branch names. Include remote-tracking refs if *remote* is True."""
-    if remote:
-        return [ref.name for ref in repo.remote().refs]
-    return [branch.name for branch in repo.branches]
+    prefix = "refs/remotes/origin/" if remote else "refs/heads/"
+    strip = "refs/remotes/" if remote else prefix
+    return [name.removeprefix(strip) for name in _read_refs(repo) if name.startswith(prefix)]
+
+
+def build_sha_to_branch_index(repo: Repo) -> dict[str, str]:
+    """Map every ref's commit sha to its short name (last path component).
+
+    When several refs share a tip the last one in refname order wins.
+    """
+    return {sha: name.rsplit("/", 1)[-1] for name, sha in _read_refs(repo).items()}
 
 
 def resolve_ref_to_branch(repo: Repo, sha: str) -> str | None:
-    """Try to find a branch name whose tip matches *sha*."""
-    for ref in repo.references:
-        if ref.commit.hexsha == sha:
-            return ref.name.split("/")[-1]
-    return None
+    """Try to find a branch name whose tip matches *sha*.
+
+    Builds the whole ref index for one lookup; call
+    :func:`build_sha_to_branch_index` directly to resolve many shas.
+    """
+    return build_sha_to_branch_index(repo).get(sha)
+
+
+def resolve_date(repo: Repo, expr: str) -> str:
+    """Pin a git date expression (``2024-01-31``, ``"6 months ago"``) to ``@<unix time>``.
+
+    The pinned form means the same thing on every run, so it is safe to use
+    in cache keys.
+    """
+    out = repo.git.rev_parse(f"--since={expr}")  # "--max-age=<unix time>"
+    return "@" + out.rpartition("=")[2]
+
+
+_COMMIT_GRAPH_MAX_AGE = 24 * 60 * 60  # seconds
+
+
+def ensure_commit_graph(repo: Repo) -> None:
+    """Write the repository's commit-graph if it is missing or over a day old.
+
+    With a commit-graph, ``git log``/``rev-list`` read parents and commit
+    dates without inflating each commit object, and ``--changed-paths``
+    adds Bloom filters for pathspec-limited logs.  Best-effort: a read-only
+    repository or an old git just leaves the history walks unaccelerated.
+    """
+    info = Path(repo.common_dir) / "objects" / "info"
+    for graph in (info / "commit-graph", info / "commit-graphs" / "commit-graph-chain"):
+        try:
+            if time.time() - graph.stat().st_mtime < _COMMIT_GRAPH_MAX_AGE:
+                return
+        except OSError:
+            continue
+    try:
+        repo.git.commit_graph("write", "--reachable", "--changed-paths")
+    except (GitCommandError, OSError):
+        pass
+
+
+class CommitNumstat(NamedTuple):
+    """One commit's header fields and its ``commit.stats.total`` equivalent."""
+
+    sha: str
+    author_name: str
+    author_email: str
+    committed_at: datetime
+    insertions: int
+    deletions: int
+    files: int
+    paths: list[str]
+
+
+# Where the history walks below run: "gitpython" parses `git` output,
+# "pygit2" walks and diffs in-process with libgit2 (see archeologit.pygit2_backend)
+BACKENDS = ("gitpython", "pygit2")
+_backend = "gitpython"
+
+
+def set_backend(name: str) -> None:
+    """Select the backend for every history walk in this process (``main.py --backend``)."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}; expected one of {', '.join(BACKENDS)}")
+    if name == "pygit2":
+        try:
+            import archeologit.pygit2_backend  # noqa: F401
+        except ImportError:
+            raise ValueError("The pygit2 backend needs pygit2: `uv sync --extra pygit2`")
+    _backend = name
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def _walk_limits(max_count: int | None, since: str | None, until: str | None) -> list[str]:
+    """``git log``/``rev-list`` flags that stop the walk early."""
+    args: list[str] = []
+    if max_count is not None:
+        args.append(f"--max-count={max_count}")
+    if since is not None:
+        args.append(f"--since={since}")
+    if until is not None:
+        args.append(f"--until={until}")
+    return args
+
+
+def _usable_cpus() -> int:
+    """CPUs this process may run on (honours affinity masks / container cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# Commits are independent, so a long walk is split into up to this many
+# contiguous slices of `git rev-list`, each diffed by its own `git log`.
+# Neighbouring commits share most of their trees and delta bases, so
+# contiguous slices keep each worker's pack reads local.
+_LOG_WORKERS = min(8, _usable_cpus())
+_MIN_SLICE = 500
+
+
+def _log_stdin(repo: Repo, shas: list[str], args: list[str]) -> bytes:
+    """Raw output of ``git log <args>`` for exactly *shas*, in that order (no walk)."""
+    with tempfile.TemporaryFile() as stdin:
+        stdin.write("\n".join(shas).encode())
+        stdin.seek(0)
+        return repo.git.log("--no-walk=unsorted", "--stdin", *args, istream=stdin, stdout_as_string=False)
+
+
+def _log_slices(repo: Repo, rev: str, limits: list[str], args: list[str], workers: int) -> Iterator[bytes]:
+    """Yield the output of ``git log <args>`` over the history of *rev*, slice by slice.
+
+    Slices come back newest first, so concatenating them gives exactly the
+    output of one ``git log <args> rev``.
+    """
+    shas = repo.git.rev_list(rev, *limits).split()
+    if not shas:
+        return
+    n = max(1, min(workers, len(shas) // _MIN_SLICE))
+    size = -(-len(shas) // n)  # ceil
+    slices = [shas[i:i + size] for i in range(0, len(shas), size)]
+
+    def run(chunk: list[str]) -> bytes:
+        with Repo(repo.git_dir) as worker_repo:
+            return _log_stdin(worker_repo, chunk, args)
+
+    if n == 1:
+        yield from map(run, slices)
+        return
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        yield from pool.map(run, slices)
+
+
+def iter_numstat(
+    repo: Repo,
+    rev: str,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    workers: int = _LOG_WORKERS,
+    reverse: bool = False,
+) -> Iterator[CommitNumstat]:
+    """Yield per-commit line stats for *rev* from ``git log --numstat``.
+
+    Same commits, order and numbers as walking ``repo.iter_commits(rev)`` and
+    reading ``commit.stats.total``, without one ``git diff`` per commit: merges
+    are diffed against their first parent, renames are not detected and binary
+    files count as changed with 0 lines.  Long histories are diffed by up to
+    *workers* ``git log`` processes at once.  *reverse* yields the same
+    commits oldest first.
+    """
+    if _backend == "pygit2":
+        from archeologit import pygit2_backend
+
+        yield from pygit2_backend.iter_numstat(repo, rev, max_count, since, until, reverse)
+        return
+
+    args = [
+        "--numstat",
+        "--no-renames",
+        "--diff-merges=first-parent",
+        "--format=%x00%H%x00%an%x00%ae%x00%cI",
+    ]
+    limits = _walk_limits(max_count, since, until) + (["--reverse"] if reverse else [])
+    for out in _log_slices(repo, rev, limits, args, workers):
+        yield from _parse_numstat(out.decode("utf-8", "replace"))
+
+
+def _parse_numstat(out: str) -> Iterator[CommitNumstat]:
+    # "\0sha\0name\0email\0date\n\n<numstat lines>" per commit
+    fields = out.split("\x00")
+    for i in range(1, len(fields), 4):
+        sha, name, email, rest = fields[i:i + 4]
+        date, _, numstat = rest.partition("\n")
+        yield CommitNumstat(sha, name, email, datetime.fromisoformat(date), *_sum_numstat(numstat))
+
+
+def _sum_numstat(numstat: str) -> tuple[int, int, int, list[str]]:
+    """(insertions, deletions, files, paths) of a block of ``--numstat`` lines."""
+    insertions = deletions = files = 0
+    paths: list[str] = []
+    for line in numstat.splitlines():
+        if not line:
+            continue
+        added, removed, path = line.split("\t", 2)
+        files += 1
+        paths.append(path)
+        if added != "-":  # binary file
+            insertions += int(added)
+            deletions += int(removed)
+    return insertions, deletions, files, paths
+
+
+class CommitRecord(NamedTuple):
+    """The header fields of one commit, as read by :func:`iter_commit_records`."""
+
+    sha: str
+    parents: list[str]
+    author_name: str
+    author_email: str
+    committed_at: datetime
+    message: str  # full raw message, like ``Commit.message``
+
+
+# One NUL-terminated record per commit (``-z``), fields split by US (0x1f);
+# the message goes last so it may contain anything but NUL
+_RECORD_FORMAT = "%H%x1f%P%x1f%an%x1f%ae%x1f%cI%x1f%B"
+
+
+def _iter_nul_records(stream: IO[bytes], chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    buf = b""
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        buf += chunk
+        *records, buf = buf.split(b"\x00")
+        yield from records
+    if buf:
+        yield buf
+
+
+def iter_commit_records(
+    repo: Repo,
+    rev: str,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> Iterator[CommitRecord]:
+    """Stream the commits of *rev* (same order as ``repo.iter_commits``) from one ``git log``.
+
+    Unlike ``iter_commits`` this never builds GitPython ``Commit`` objects, so
+    reading messages, dates and parents costs no per-commit object lookups.
+    """
+    if _backend == "pygit2":
+        from archeologit import pygit2_backend
+
+        yield from pygit2_backend.iter_commit_records(repo, rev, max_count, since, until)
+        return
+
+    args = [rev, "-z", f"--format={_RECORD_FORMAT}", *_walk_limits(max_count, since, until)]
+    proc = repo.git.log(*args, as_process=True)
+    yield from _parse_records(_iter_nul_records(proc.stdout))
+    proc.wait()  # raises GitCommandError if git failed
+
+
+def batch_commit_records(repo: Repo, shas: list[str]) -> Iterator[CommitRecord]:
+    """Header fields for an explicit list of commits, in the given order.
+
+    One ``git log --no-walk --stdin`` for the whole batch instead of a
+    ``repo.commit(sha)`` lookup per commit.
+    """
+    if _backend == "pygit2":
+        from archeologit import pygit2_backend
+
+        yield from pygit2_backend.batch_commit_records(repo, shas)
+        return
+
+    if not shas:
+        return
+    out = _log_stdin(repo, shas, ["-z", f"--format={_RECORD_FORMAT}"])
+    yield from _parse_records(record for record in out.split(b"\x00") if record)
+
+
+def _parse_records(records: Iterator[bytes]) -> Iterator[CommitRecord]:
+    for record in records:
+        sha, parents, name, email, date, message = record.decode("utf-8", "replace").split("\x1f", 5)
+        yield CommitRecord(
+            sha=sha,
+            parents=parents.split(),
+            author_name=name,
+            author_email=email,
+            committed_at=datetime.fromisoformat(date),
+            message=message,
+        )
+
+
+def iter_commits_with_numstat(
+    repo: Repo,
+    rev: str,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    workers: int = _LOG_WORKERS,
+) -> Iterator[tuple[CommitRecord, CommitNumstat]]:
+    """:func:`iter_commit_records` and :func:`iter_numstat` in lockstep, from one walk.
+
+    For callers that need both a commit's message/parents and its line stats
+    (see :func:`~archeologit.analyzers.combined.run_all`).
+    """
+    if _backend == "pygit2":
+        from archeologit import pygit2_backend
+
+        yield from pygit2_backend.iter_commits_with_numstat(repo, rev, max_count, since, until)
+        return
+
+    args = [
+        "--numstat",
+        "--no-renames",
+        "--diff-merges=first-parent",
+        "--format=%x00%H%x00%P%x00%an%x00%ae%x00%cI%x00%B%x00",
+    ]
+    for out in _log_slices(repo, rev, _walk_limits(max_count, since, until), args, workers):
+        # "\0sha\0parents\0name\0email\0date\0message\0\n\n<numstat lines>" per commit
+        fields = out.decode("utf-8", "replace").split("\x00")
+        for i in range(1, len(fields), 7):
+            sha, parents, name, email, date, message, numstat = fields[i:i + 7]
+            committed_at = datetime.fromisoformat(date)
+            yield (
+                CommitRecord(sha, parents.split(), name, email, committed_at, message),
+                CommitNumstat(sha, name, email, committed_at, *_sum_numstat(numstat)),
+            )
+
+
+class CommitChanges(NamedTuple):
+    """One commit and the files it changed, as read by :func:`iter_raw_changes`."""
+
+    sha: str
+    committed_at: datetime
+    changes: list[tuple[str, str]]  # (status letter, path) — "A", "D", "M", "R", …
+
+
+def iter_raw_changes(
+    repo: Repo,
+    rev: str,
+    max_count: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    workers: int = _LOG_WORKERS,
+) -> Iterator[CommitChanges]:
+    """Yield every commit of *rev* with its changed paths from ``git log --raw``.
+
+    Matches diffing each commit against its first parent with GitPython
+    (renames detected, the root commit diffed against the empty tree); for
+    renames and copies the path is the new one.  Long histories are diffed by
+    up to *workers* ``git log`` processes at once.
+    """
+    if _backend == "pygit2":
+        from archeologit import pygit2_backend
+
+        yield from pygit2_backend.iter_raw_changes(repo, rev, max_count, since, until)
+        return
+
+    args = [
+        "--raw",
+        "-z",
+        "-M",
+        "--no-abbrev",
+        "--diff-merges=first-parent",
+        "--format=%x1e%H%x1f%cI",
+    ]
+    for out in _log_slices(repo, rev, _walk_limits(max_count, since, until), args, workers):
+        yield from _parse_raw(iter(out.split(b"\x00")))
+
+
+def _parse_raw(tokens: Iterator[bytes]) -> Iterator[CommitChanges]:
+    # NUL-separated tokens: "\x1e<sha>\x1f<date>" opens a commit, then per file a
+    # ":<modes> <blobs> <status>" token followed by one path (two for R/C)
+    current: CommitChanges | None = None
+    for token in tokens:
+        text = token.decode("utf-8", "replace").lstrip("\n")
+        if text.startswith("\x1e"):
+            if current is not None:
+                yield current
+            sha, date = text[1:].split("\x1f", 1)
+            current = CommitChanges(sha=sha, committed_at=datetime.fromisoformat(date), changes=[])
+        elif text.startswith(":") and current is not None:
+            status = text.rsplit(" ", 1)[-1][0]
+            path = next(tokens)
+            if status in "RC":
+                path = next(tokens)
+            current.changes.append((status, path.decode("utf-8", "replace")))
+    if current is not None:
+        yield current
 
 
 if __name__ == "__main__":
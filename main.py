@@ -16,17 +16,22 @@ Options:
     --repo PATH              Path to the git repository (default: aily-super-agent)
     --branch NAME            Branch to analyse (default: repo default branch)
     --max N                  Cap commits per analyzer (default: unlimited)
+    --since DATE             Only walk commits newer than DATE (YYYY-MM-DD or any git date)
+    --until DATE             Only walk commits older than DATE
     --exclude-author NAME    Exclude commits by this author (repeatable)
-    --output FILE            Write JSON output to FILE (default: print to stdout)
+    --output FILE            Write JSON output to FILE (default: print to stdout);
+                             a .jsonl FILE gets one record per line, streamed
     --json                   Force JSON output even for commands that normally print a summary
+    --no-cache               Ignore cached analyzer results and re-walk the history
+    --no-commit-graph        Don't write/refresh the repo's commit-graph before walking
+    --backend NAME           gitpython (default) or pygit2 (needs the pygit2 extra)
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from pathlib import Path
+from typing import Any
 
 from archeologit.analyzers import (
     get_branch_authors,
@@ -35,10 +40,14 @@ from archeologit.analyzers import (
     get_folder_changes,
     get_loc_over_time,
     get_merges_to_main,
+    run_all,
 )
+from archeologit import cache
 from archeologit.analyzers.diff_stats import aggregate as diff_aggregate
-from archeologit.models import to_json
-from archeologit.repo import default_branch, open_repo
+from archeologit.analyzers.folders import iter_folder_changes
+from archeologit.analyzers.loc import iter_loc_over_time
+from archeologit.models import to_json, to_json_stream, to_jsonl
+from archeologit.repo import BACKENDS, default_branch, ensure_commit_graph, open_repo, resolve_date, set_backend
 
 
 def _exclude(items, exclude_authors: list[str]):
@@ -49,12 +58,31 @@ def _exclude(items, exclude_authors: list[str]):
     return [i for i in items if getattr(i, "author_name", "").lower() not in lowered]
 
 
-def cmd_log(args: argparse.Namespace) -> None:
+def _open_repo(args: argparse.Namespace):
+    """Open ``--repo`` and pin ``--since``/``--until`` to absolute times (stable cache keys)."""
     repo = open_repo(args.repo)
-    log = get_commit_log(repo, branch=args.branch, max_count=args.max)
+    if not args.no_commit_graph:
+        ensure_commit_graph(repo)
+    if args.since:
+        args.since = resolve_date(repo, args.since)
+    if args.until:
+        args.until = resolve_date(repo, args.until)
+    if args.max is None and args.since is None:
+        print("note: walking the full history; pass --max N or --since DATE to limit it", file=sys.stderr)
+    return repo
+
+
+def _walk(args: argparse.Namespace) -> dict:
+    """Walk limits shared by every analyzer call."""
+    return {"max_count": args.max, "since": args.since, "until": args.until}
+
+
+def cmd_log(args: argparse.Namespace) -> None:
+    repo = _open_repo(args)
+    log = get_commit_log(repo, branch=args.branch, **_walk(args))
     log = _exclude(log, args.exclude_authors)
     if args.json or args.output:
-        _emit(to_json(log), args.output)
+        _emit(log, args.output)
     else:
         branch = args.branch or default_branch(repo)
         print(f"Commit log: '{branch}' — {len(log)} commits\n")
@@ -65,10 +93,10 @@ def cmd_log(args: argparse.Namespace) -> None:
 
 
 def cmd_merges(args: argparse.Namespace) -> None:
-    repo = open_repo(args.repo)
-    merges = get_merges_to_main(repo, branch=args.branch, max_count=args.max)
+    repo = _open_repo(args)
+    merges = get_merges_to_main(repo, branch=args.branch, **_walk(args))
     if args.json or args.output:
-        _emit(to_json(merges), args.output)
+        _emit(merges, args.output)
     else:
         branch = args.branch or default_branch(repo)
         classic = sum(1 for m in merges if m.merge_style == "classic")
@@ -81,15 +109,15 @@ def cmd_merges(args: argparse.Namespace) -> None:
 
 
 def cmd_authors(args: argparse.Namespace) -> None:
-    repo = open_repo(args.repo)
+    repo = _open_repo(args)
     branches_arg = [args.branch] if args.branch else None
-    data = get_branch_authors(repo, branches=branches_arg, max_count=args.max)
+    data = get_branch_authors(repo, branches=branches_arg, **_walk(args))
     if args.exclude_authors:
         lowered = {a.lower() for a in args.exclude_authors}
         for ba in data:
             ba.authors = [a for a in ba.authors if a.author_name.lower() not in lowered]
     if args.json or args.output:
-        _emit(to_json(data), args.output)
+        _emit(data, args.output)
     else:
         for ba in data:
             print(f"Branch: {ba.branch_name} — {len(ba.authors)} contributor(s)")
@@ -102,10 +130,13 @@ def cmd_authors(args: argparse.Namespace) -> None:
 
 
 def cmd_folders(args: argparse.Namespace) -> None:
-    repo = open_repo(args.repo)
-    changes = get_folder_changes(repo, branch=args.branch, max_count=args.max, depth=args.folder_depth)
+    repo = _open_repo(args)
+    if _streams_jsonl(args):
+        _emit(iter_folder_changes(repo, branch=args.branch, **_walk(args), depth=args.folder_depth), args.output)
+        return
+    changes = get_folder_changes(repo, branch=args.branch, **_walk(args), depth=args.folder_depth)
     if args.json or args.output:
-        _emit(to_json(changes), args.output)
+        _emit(changes, args.output)
     else:
         branch = args.branch or default_branch(repo)
         print(f"Folder changes on '{branch}': {len(changes)} event(s)\n")
@@ -116,14 +147,11 @@ def cmd_folders(args: argparse.Namespace) -> None:
 
 
 def cmd_diffstats(args: argparse.Namespace) -> None:
-    repo = open_repo(args.repo)
-    stats = get_diff_stats(repo, branch=args.branch, max_count=args.max)
+    repo = _open_repo(args)
+    stats = get_diff_stats(repo, branch=args.branch, **_walk(args))
     agg = diff_aggregate(stats)
     if args.json or args.output:
-        _emit(
-            json.dumps({"aggregate": agg, "per_commit": json.loads(to_json(stats))}, indent=2),
-            args.output,
-        )
+        _emit({"aggregate": agg, "per_commit": stats}, args.output)
     else:
         branch = args.branch or default_branch(repo)
         print(f"Diff stats for '{branch}' ({agg['commit_count']} commits):")
@@ -138,10 +166,13 @@ def cmd_diffstats(args: argparse.Namespace) -> None:
 
 
 def cmd_loc(args: argparse.Namespace) -> None:
-    repo = open_repo(args.repo)
-    snapshots = get_loc_over_time(repo, branch=args.branch, max_count=args.max)
+    repo = _open_repo(args)
+    if _streams_jsonl(args):
+        _emit(iter_loc_over_time(repo, branch=args.branch, **_walk(args)), args.output)
+        return
+    snapshots = get_loc_over_time(repo, branch=args.branch, **_walk(args))
     if args.json or args.output:
-        _emit(to_json(snapshots), args.output)
+        _emit(snapshots, args.output)
     else:
         branch = args.branch or default_branch(repo)
         if snapshots:
@@ -156,62 +187,75 @@ def cmd_loc(args: argparse.Namespace) -> None:
 
 
 def cmd_all(args: argparse.Namespace) -> None:
-    repo = open_repo(args.repo)
+    repo = _open_repo(args)
     branch = args.branch or default_branch(repo)
     branches_arg = [branch] if args.branch else None
 
     print(f"Running all analyzers on '{repo.working_dir}' (branch: {branch}) …")
 
-    log = get_commit_log(repo, branch=branch, max_count=args.max)
-    log = _exclude(log, args.exclude_authors)
+    # One shared walk of the history instead of one per analyzer
+    results = run_all(repo, branch=branch, branches=branches_arg, depth=args.folder_depth, **_walk(args))
+
+    log = _exclude(results.commit_log, args.exclude_authors)
     print(f"  commit_log    : {len(log)} commits")
 
-    merges = get_merges_to_main(repo, branch=branch, max_count=args.max)
+    merges = results.merges
     print(f"  merges        : {len(merges)} merge events")
 
-    authors = get_branch_authors(repo, branches=branches_arg, max_count=args.max)
+    authors = results.authors
     if args.exclude_authors:
         lowered = {a.lower() for a in args.exclude_authors}
         for ba in authors:
             ba.authors = [a for a in ba.authors if a.author_name.lower() not in lowered]
     print(f"  authors       : analysed {len(authors)} branch(es)")
 
-    folders = get_folder_changes(repo, branch=branch, max_count=args.max, depth=args.folder_depth)
+    folders = results.folder_changes
     print(f"  folders       : {len(folders)} folder-change events")
 
-    diff_stats = get_diff_stats(repo, branch=branch, max_count=args.max)
+    diff_stats = results.diff_stats
     agg = diff_aggregate(diff_stats)
     print(f"  diff_stats    : +{agg['total_insertions']} / -{agg['total_deletions']} lines total")
 
-    loc = get_loc_over_time(repo, branch=branch, max_count=args.max)
+    loc = results.loc_over_time
     if loc:
         print(f"  loc           : {loc[0].cumulative_loc} → {loc[-1].cumulative_loc} (net LOC)")
 
     report = {
         "repo": str(repo.working_dir),
         "branch": branch,
-        "commit_log": json.loads(to_json(log)),
-        "merges": json.loads(to_json(merges)),
-        "authors": json.loads(to_json(authors)),
-        "folder_changes": json.loads(to_json(folders)),
+        "commit_log": log,
+        "merges": merges,
+        "authors": authors,
+        "folder_changes": folders,
         "diff_stats": {
             "aggregate": agg,
-            "per_commit": json.loads(to_json(diff_stats)),
+            "per_commit": diff_stats,
         },
-        "loc_over_time": json.loads(to_json(loc)),
+        "loc_over_time": loc,
     }
 
+    # Encoded straight into the file, one record at a time
     output_path = args.output or "report.json"
-    Path(output_path).write_text(json.dumps(report, indent=2))
+    with open(output_path, "w") as f:
+        to_json_stream(report, f)
     print(f"\nFull report written to: {output_path}")
 
 
-def _emit(text: str, output_path: str | None) -> None:
+def _streams_jsonl(args: argparse.Namespace) -> bool:
+    """``--output *.jsonl``: write records one per line as they are produced."""
+    return bool(args.output) and args.output.endswith(".jsonl")
+
+
+def _emit(data: Any, output_path: str | None) -> None:
     if output_path:
-        Path(output_path).write_text(text)
+        with open(output_path, "w") as f:
+            if output_path.endswith(".jsonl") and not isinstance(data, dict):
+                to_jsonl(data, f)
+            else:
+                to_json_stream(data, f)
         print(f"Output written to: {output_path}")
     else:
-        print(text)
+        print(to_json(data))
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -220,6 +264,9 @@ def build_parser() -> argparse.ArgumentParser:
     common.add_argument("--repo", default="/Users/vaskendermardiros/Repos/aily-super-agent", metavar="PATH", help="Path to the git repo (default: aily-super-agent)")
     common.add_argument("--branch", default=None, metavar="NAME", help="Branch to analyse")
     common.add_argument("--max", type=int, default=None, metavar="N", help="Cap commits per analyzer")
+    common.add_argument("--since", default=None, metavar="DATE",
+                        help="Only walk commits newer than DATE (YYYY-MM-DD or any git date, e.g. '6 months ago')")
+    common.add_argument("--until", default=None, metavar="DATE", help="Only walk commits older than DATE")
     common.add_argument("--folder-depth", dest="folder_depth", type=int, default=4, metavar="N",
                         help="Directory depth for folder structure analysis (default: 4)")
     common.add_argument(
@@ -230,8 +277,14 @@ def build_parser() -> argparse.ArgumentParser:
         default=[],
         help="Exclude commits by this author name (repeatable, e.g. --exclude-author ailyoperations)",
     )
-    common.add_argument("--output", default=None, metavar="FILE", help="Write JSON output to FILE")
+    common.add_argument("--output", default=None, metavar="FILE", help="Write JSON output to FILE (.jsonl: one record per line)")
     common.add_argument("--json", action="store_true", help="Force JSON output")
+    common.add_argument("--backend", choices=BACKENDS, default="gitpython",
+                        help="How history is read: parse `git` output (default) or libgit2 via pygit2")
+    common.add_argument("--no-cache", dest="no_cache", action="store_true",
+                        help="Ignore cached analyzer results and re-walk the history")
+    common.add_argument("--no-commit-graph", dest="no_commit_graph", action="store_true",
+                        help="Don't write/refresh the repo's commit-graph before walking the history")
 
     parser = argparse.ArgumentParser(
         prog="archeologit",
@@ -265,6 +318,11 @@ _COMMANDS = {
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+    cache.set_enabled(not args.no_cache)
+    try:
+        set_backend(args.backend)
+    except ValueError as exc:
+        parser.error(str(exc))
     _COMMANDS[args.command](args)
 
 